@@ -0,0 +1,30 @@
+import turtle
+
+import numpy as np
+
+from lab.busca import sorteia_coords
+from lab.busca.agente import Agente
+from lab.busca.alvo import Alvo
+from lab.busca.informada import a_estrela
+from lab.busca.eventos import EXPANDE
+from lab.busca.grade import Grade
+
+rnd = np.random.default_rng(23)
+grade = Grade(fps=5)
+agente = Agente(grade, 8, 8)
+alvo = Alvo(grade, *sorteia_coords(grade, rnd))
+
+
+def observa(evento, celula):
+    if evento == EXPANDE:
+        agente.move(*grade.mapa.coords(celula))
+    grade.observa(evento, celula)
+
+
+resultado = a_estrela(grade, agente, alvo, observador=observa)
+for linha, coluna in resultado.coords(grade.mapa):
+    grade.pinta(linha, coluna, cor="yellow")
+grade.pinta(*agente.posicao, cor="green" if agente == alvo else "black")
+grade.desenha(forca=True)
+print(resultado)
+turtle.done()
@@ -28,5 +28,5 @@ while agente != alvo and sucessores:
     grade.desenha()
 
 grade.pinta(*agente.posicao, cor="green" if agente == alvo else "black")
-grade.desenha()
+grade.desenha(forca=True)
 turtle.done()
@@ -1,30 +1,31 @@
 import turtle
-from collections import deque
 
 import numpy as np
 
 from lab.busca import sorteia_coords
 from lab.busca.agente import Agente
 from lab.busca.alvo import Alvo
+from lab.busca.cega import largura
+from lab.busca.eventos import EXPANDE
 from lab.busca.grade import Grade
 
 rnd = np.random.default_rng(23)
 grade = Grade(fps=5)
 agente = Agente(grade, 8, 8)
 alvo = Alvo(grade, *sorteia_coords(grade, rnd))
-visitados = set()
-fronteira = deque([agente.posicao])
-while agente != alvo and fronteira:
-    proximo = fronteira.pop()  # Retira da lista o elemento mais à direita.
-    agente.move(*proximo)
-    grade.pinta(*proximo, cor="blue")
-    visitados.add(proximo)
-    for sucessor in agente.sucessores:
-        if sucessor not in visitados and sucessor not in fronteira:
-            grade.pinta(*sucessor, cor="lightgreen")
-            fronteira.appendleft(sucessor)  # Insere elemento à esquerda da fila.
-    grade.desenha()
 
+
+def observa(evento, celula):
+    if evento == EXPANDE:
+        agente.move(*grade.mapa.coords(celula))
+    grade.observa(evento, celula)
+
+
+# A fronteira da busca é uma fila com índice de pertinência, então não há busca linear por 'sucessor in fronteira'.
+resultado = largura(grade, agente, alvo, observador=observa)
+for linha, coluna in resultado.coords(grade.mapa):
+    grade.pinta(linha, coluna, cor="yellow")
 grade.pinta(*agente.posicao, cor="green" if agente == alvo else "black")
-grade.desenha()
+grade.desenha(forca=True)
+print(resultado)
 turtle.done()
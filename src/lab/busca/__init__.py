@@ -1,6 +1,7 @@
 import numpy as np
 
 from lab.busca.alvo import Alvo
+from lab.busca.mapa import Mapa
 
 
 def sorteia_de_lista(lst, rnd):
@@ -1,35 +1,48 @@
 import turtle
 
+from lab.busca.mapa import DIRECOES, mapa_de
+
 
 class Agente:
+    """Agente numa ``Grade`` ou, sem desenho, direto num ``Mapa``.
+
+    A tartaruga só é criada no primeiro movimento, e só se houver tela (``Grade``); depois é sempre a mesma.
+    """
+
     def __init__(self, grade, linha, coluna, cor="black", forma="turtle"):
-        self.direcoes_possiveis = {"norte": (1, 0), "sul": (-1, 0), "oeste": (0, 1), "leste": (0, -1)}
+        self.direcoes_possiveis = DIRECOES
         self.grade = grade
         self.linha = linha
         self.coluna = coluna
-        self.turtle = turtle.Turtle(shape=forma)
-        self.turtle.color(cor)
-        self.turtle.penup()
+        self.cor, self.forma = cor, forma
+        self._turtle = None
+
+    @property
+    def turtle(self):
+        if self._turtle is None and hasattr(self.grade, "screen"):
+            self._turtle = turtle.Turtle(shape=self.forma)
+            self._turtle.color(self.cor)
+            self._turtle.penup()
+        return self._turtle
 
     def move(self, linha, coluna):
         self.linha = linha
         self.coluna = coluna
-        x, y = self.grade(self.linha, self.coluna)
-        self.turtle.goto(x, y)
+        if self.turtle is not None:
+            self.turtle.goto(*self.grade(self.linha, self.coluna))
 
     @property
     def posicao(self):
         return self.linha, self.coluna
 
+    @property
+    def indice(self):
+        return mapa_de(self.grade).indice(self.linha, self.coluna)
+
     @property
     def sucessores(self):
-        lst = []
-        for _, (l, c) in self.direcoes_possiveis.items():
-            linha = self.linha + l
-            coluna = self.coluna + c
-            if 1 <= linha <= self.grade.nlinhas and 1 <= coluna <= self.grade.ncolunas:
-                lst.append((linha, coluna))
-        return lst
+        mapa = mapa_de(self.grade)
+        return [mapa.coords(i) for i in mapa.sucessores(self.indice)]
 
     def __repr__(self):
         return f"Agente({self.linha}, {self.coluna})"
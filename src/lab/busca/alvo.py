@@ -2,25 +2,37 @@ import turtle
 
 
 class Alvo:
+    """Alvo numa ``Grade`` ou, sem desenho, direto num ``Mapa``.
+
+    É desenhado por um único marcador persistente, criado no primeiro ``recolore``; redesenhar apenas o move e
+    recolore, sem criar itens novos na tela, então o custo por quadro não cresce ao longo da execução.
+    """
+
     def __init__(self, grade, linha, coluna, size=12, cor="red"):
         self.linha = linha
         self.coluna = coluna
         self.grade = grade
         self.cor = cor
-        self.grade.alvo=self
-        t = turtle.Turtle()
-        t.hideturtle()
-        t.speed(0)
-        t.penup()
+        self.marcador = None
+        if hasattr(grade, "screen"):
+            self.grade.alvo = self
+
+    def move(self, linha, coluna):
+        self.linha = linha
+        self.coluna = coluna
 
     def recolore(self, size=16, cor=None):
+        if not hasattr(self.grade, "screen"):
+            return
         if cor is None:
             cor = self.cor
-        m = turtle.Turtle()
-        m.hideturtle()
-        m.penup()
-        m.goto(*self.grade(self.linha, self.coluna))
-        m.dot(size, cor)
+        if self.marcador is None:
+            self.marcador = turtle.Turtle(shape="circle")
+            self.marcador.speed(0)
+            self.marcador.penup()
+        self.marcador.shapesize(size / 20, size / 20, 0)  # A forma "circle" tem 20 pixels de diâmetro.
+        self.marcador.color(cor)
+        self.marcador.goto(*self.grade(self.linha, self.coluna))
 
     def __repr__(self):
         return f"Alvo({self.linha}, {self.coluna})"
@@ -0,0 +1,124 @@
+"""Busca "anytime" com prazo: ARA* (Likhachev, Gordon e Thrun, 2003).
+
+Começa como A* ponderado, com ``f = g + peso * h``, que acha depressa um caminho até ``peso`` vezes pior que o
+ótimo. Depois reduz o peso e melhora o caminho reaproveitando o trabalho anterior: só os estados cujo ``g`` baixou
+desde que foram expandidos (a lista ``inconsistentes``) voltam à lista aberta. Cada solução vem com o limite de
+subotimalidade comprovado, ``custo / limite <= ótimo``, que pode ser bem menor que o peso usado.
+"""
+
+from heapq import heapify, heappop, heappush
+from time import perf_counter
+
+import numpy as np
+
+from lab.busca.eventos import EXPANDE, ENFILEIRA
+from lab.busca.heuristicas import padrao
+from lab.busca.mapa import mapa_de
+from lab.busca.resultado import Resultado, SEM_PAI, reconstroi
+
+
+class Solucao(Resultado):
+    """``Resultado`` de uma busca anytime, com o peso usado e o limite de subotimalidade comprovado."""
+
+    def __init__(self, caminho, custo, expandidos, fronteira_max=0, peso=np.inf, limite=np.inf, tempo=0.0):
+        super().__init__(caminho, custo, expandidos, fronteira_max, tempo)
+        self.peso = peso
+        self.limite = limite  # O custo é no máximo ``limite`` vezes o ótimo.
+
+    def __repr__(self):
+        return (f"Solucao(passos={len(self.caminho) - 1}, custo={self.custo}, expandidos={self.expandidos}, "
+                f"peso={self.peso:g}, limite={self.limite:.3f}, tempo={self.tempo:.4f})")
+
+
+def solucoes(mapa, origem, destino, heuristica=None, peso=3.0, passo=0.5, prazo=None, orcamento=None,
+             observador=None):
+    """Gera soluções ``Solucao`` de custo decrescente até provar a ótima ou esgotar o prazo ou o orçamento.
+
+    ``prazo`` é o tempo máximo em segundos e ``orcamento``, o número máximo de expansões, ambos contados desde a
+    chamada. O peso cai ``passo`` a cada melhoria, até 1. ``heuristica`` deve ser admissível; por padrão, é a
+    natural da vizinhança do mapa.
+    """
+    inicio = perf_counter()
+    mapa = mapa_de(mapa)
+    origem, destino = mapa.estado(origem), mapa.estado(destino)
+    heuristica = padrao(mapa) if heuristica is None else heuristica
+    g = np.full(mapa.n, np.inf)
+    h = np.full(mapa.n, np.nan)  # Calculada sob demanda: calcular para o mapa inteiro já custaria uma fração do prazo.
+    pais = np.full(mapa.n, SEM_PAI, dtype=np.int32)
+    fechados = mapa.bitmap()
+    na_aberta = mapa.bitmap()
+    g[origem] = 0.0
+    h[origem] = heuristica(mapa, origem, destino)
+    aberta = [(peso * h[origem], h[origem], origem)]
+    inconsistentes, fechados_agora = [], []
+    expandidos, maximo = 0, 1
+    limite_de_expansoes = np.inf if orcamento is None else orcamento
+    limite_de_tempo = np.inf if prazo is None else inicio + prazo
+    while True:
+        # Melhora o caminho com o peso atual, até que nenhum estado aberto possa encurtá-lo.
+        while aberta:
+            f, _, atual = aberta[0]
+            if fechados[atual] or f != g[atual] + peso * h[atual]:
+                heappop(aberta)  # Entrada obsoleta.
+                continue
+            if f >= g[destino]:
+                break
+            if expandidos >= limite_de_expansoes or ((expandidos & 63) == 0 and perf_counter() >= limite_de_tempo):
+                return
+            heappop(aberta)
+            na_aberta[atual] = False
+            fechados[atual] = True
+            fechados_agora.append(atual)
+            if observador is not None:
+                observador(EXPANDE, atual)
+            expandidos += 1
+            g_atual = g[atual]
+            sucessores, custos = mapa.transicoes(atual)
+            for sucessor, custo in zip(sucessores.tolist(), custos.tolist()):
+                novo = g_atual + custo
+                if novo < g[sucessor]:
+                    g[sucessor] = novo
+                    pais[sucessor] = atual
+                    if fechados[sucessor]:
+                        inconsistentes.append(sucessor)
+                        continue
+                    if np.isnan(h[sucessor]):
+                        h[sucessor] = heuristica(mapa, sucessor, destino)
+                    heappush(aberta, (novo + peso * h[sucessor], h[sucessor], sucessor))
+                    na_aberta[sucessor] = True
+                    if observador is not None:
+                        observador(ENFILEIRA, sucessor)
+            if len(aberta) > maximo:
+                maximo = len(aberta)
+        if g[destino] == np.inf:
+            # A lista aberta se esgotou sem alcançar o destino: não há caminho, qualquer que seja o peso.
+            vazio = np.empty(0, dtype=np.int64)
+            yield Solucao(vazio, np.inf, expandidos, maximo, peso, np.inf, perf_counter() - inicio)
+            return
+        # Estados que ainda podem melhorar o caminho: abertos e inconsistentes, sem repetição.
+        abertos = [x for _, _, x in aberta if na_aberta[x]]
+        pendentes = np.unique(np.array(abertos + inconsistentes, dtype=np.int64))
+        # O ``g`` dos estados após um inconsistente está desatualizado; o custo do caminho pode ser menor.
+        caminho = reconstroi(pais, destino)
+        custo = mapa.custo(caminho)
+        menor = np.min(g[pendentes] + h[pendentes]) if len(pendentes) else np.inf
+        limite = max(1.0, min(peso, custo / menor))
+        yield Solucao(caminho, custo, expandidos, maximo, peso, limite, perf_counter() - inicio)
+        if limite <= 1.0:
+            return
+        # Reduz o peso e recomeça com os pendentes, reaproveitando g e pais.
+        peso = max(1.0, peso - passo)
+        fechados[fechados_agora] = False
+        na_aberta[pendentes] = True
+        aberta = [(g[x] + peso * h[x], h[x], x) for x in pendentes.tolist()]
+        heapify(aberta)
+        inconsistentes, fechados_agora = [], []
+
+
+def ara_estrela(mapa, origem, destino, heuristica=None, peso=3.0, passo=0.5, prazo=None, orcamento=None,
+                observador=None):
+    """Melhor ``Solucao`` obtida por ``solucoes`` dentro do prazo e do orçamento (sem caminho, se nenhuma)."""
+    melhor = Solucao(np.empty(0, dtype=np.int64), np.inf, 0)
+    for melhor in solucoes(mapa, origem, destino, heuristica, peso, passo, prazo, orcamento, observador):
+        pass
+    return melhor
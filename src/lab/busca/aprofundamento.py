@@ -0,0 +1,118 @@
+"""Buscas de memória linear na profundidade: aprofundamento iterativo (IDDFS) e IDA*.
+
+Só o caminho atual fica em memória, e ciclos são detectados apenas ao longo dele. Em grades, isso repete muito
+trabalho (o mesmo estado é alcançado por muitos caminhos); a ``TabelaDeTransposicao`` opcional, de tamanho fixo,
+troca um pouco de memória por menos repetição.
+"""
+
+import numpy as np
+
+from lab.busca.eventos import EXPANDE
+from lab.busca.heuristicas import nula, padrao
+from lab.busca.mapa import mapa_de
+from lab.busca.resultado import Resultado, cronometra
+
+
+class TabelaDeTransposicao:
+    """Menor custo com que cada estado já foi alcançado na iteração atual, com no máximo ``capacidade`` entradas.
+
+    Quando cheia, a entrada mais antiga dá lugar à nova. Podar um estado alcançado de novo com custo maior ou igual
+    é seguro dentro de uma iteração, pois da primeira vez ele tinha tanto ou mais orçamento de sobra.
+    """
+
+    def __init__(self, capacidade=1 << 16):
+        self.capacidade = capacidade
+        self.custos = {}
+
+    def poda(self, estado, g):
+        """Devolve se ``estado`` pode ser podado; caso contrário, registra ``g`` para ele."""
+        anterior = self.custos.get(estado)
+        if anterior is not None and anterior <= g:
+            return True
+        if anterior is None and len(self.custos) >= self.capacidade:
+            del self.custos[next(iter(self.custos))]
+        self.custos[estado] = g
+        return False
+
+    def limpa(self):
+        self.custos.clear()
+
+    def __len__(self):
+        return len(self.custos)
+
+
+def _limitada(mapa, origem, destino, limite, heuristica, passos, tabela, observador):
+    """DFS com corte em ``f = g + h > limite``; devolve (caminho ou None, custo, menor f cortado, expandidos, pico)."""
+    def filhos(celula):
+        sucessores, custos = mapa.transicoes(celula)
+        return zip(sucessores.tolist(), [1] * len(sucessores) if passos else custos.tolist())
+
+    pilha = [(origem, 0.0, filhos(origem))]
+    no_caminho = {origem}
+    proximo, expandidos, pico = np.inf, 1, 1
+    if observador is not None:
+        observador(EXPANDE, origem)
+    while pilha:
+        celula, g, restantes = pilha[-1]
+        for filho, custo in restantes:
+            if filho in no_caminho:
+                continue
+            g_filho = g + custo
+            f = g_filho + heuristica(mapa, filho, destino)
+            if f > limite:
+                proximo = min(proximo, f)
+                continue
+            if tabela is not None and tabela.poda(filho, g_filho):
+                continue
+            if filho == destino:
+                caminho = np.array([c for c, _, _ in pilha] + [filho], dtype=np.int64)
+                return caminho, g_filho, proximo, expandidos, pico
+            pilha.append((filho, g_filho, filhos(filho)))
+            no_caminho.add(filho)
+            expandidos += 1
+            pico = max(pico, len(pilha))
+            if observador is not None:
+                observador(EXPANDE, filho)
+            break
+        else:
+            pilha.pop()
+            no_caminho.discard(celula)
+    return None, np.inf, proximo, expandidos, pico
+
+
+@cronometra
+def _aprofunda(mapa, origem, destino, heuristica, passos, tabela, limite_maximo, observador):
+    mapa = mapa_de(mapa)
+    origem, destino = mapa.estado(origem), mapa.estado(destino)
+    if origem == destino:
+        return Resultado(np.array([origem], dtype=np.int64), 0, 0, 0)
+    limite = float(heuristica(mapa, origem, destino))
+    expandidos = pico = 0
+    while limite <= limite_maximo and limite < np.inf:
+        if tabela is not None:
+            tabela.limpa()
+        caminho, custo, proximo, n, p = _limitada(mapa, origem, destino, limite, heuristica, passos, tabela, observador)
+        expandidos, pico = expandidos + n, max(pico, p)
+        if caminho is not None:
+            # O aprofundamento por passos conta passos; o custo do resultado é sempre o do caminho no mapa.
+            return Resultado(caminho, mapa.custo(caminho) if passos else custo, expandidos, pico)
+        # No aprofundamento por passos, o menor corte é sempre limite + 1; no IDA*, o menor f que passou do limite.
+        limite = proximo
+    return Resultado(np.empty(0, dtype=np.int64), np.inf, expandidos, pico)
+
+
+def aprofundamento_iterativo(mapa, origem, destino, tabela=None, limite_maximo=np.inf, observador=None):
+    """Busca em profundidade com limite de passos crescente; acha o caminho com menos passos.
+
+    Sem caminho, todas as rotas simples acabam sendo tentadas; ``limite_maximo`` encerra a busca antes disso.
+    """
+    return _aprofunda(mapa, origem, destino, nula, True, tabela, limite_maximo, observador)
+
+
+def ida_estrela(mapa, origem, destino, heuristica=None, tabela=None, limite_maximo=np.inf, observador=None):
+    """IDA*: aprofundamento iterativo com limite em ``f = g + h``; ótimo para heurística admissível.
+
+    Por padrão, ``heuristica`` é a admissível natural da vizinhança do mapa.
+    """
+    heuristica = padrao(mapa_de(mapa)) if heuristica is None else heuristica
+    return _aprofunda(mapa, origem, destino, heuristica, False, tabela, limite_maximo, observador)
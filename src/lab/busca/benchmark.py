@@ -0,0 +1,120 @@
+"""Benchmark das buscas de ``lab.busca`` em grades de vários tamanhos e densidades de obstáculos.
+
+Uso: ``python -m lab.busca.benchmark --tamanhos 15 256 --algoritmos a_estrela salto --saida bench.json``
+
+Cada medida traz expansões por segundo, pico da fronteira, pico de memória (``tracemalloc``, numa segunda execução
+para não afetar o tempo) e tempo de parede; o JSON inclui as versões envolvidas, para comparar entre versões.
+"""
+
+import argparse
+import json
+import platform
+import time
+import tracemalloc
+from datetime import datetime
+from importlib import metadata
+
+import numpy as np
+
+from lab.busca import Mapa, sorteia_coords
+from lab.busca.cega import largura, largura_bidirecional, largura_vetorizada, profundidade
+from lab.busca.informada import a_estrela, custo_uniforme, gulosa
+from lab.busca.salto import salto
+from lab.busca.terreno import obstaculos
+
+# Nome: (busca, vizinhança do mapa em que ela roda).
+ALGORITMOS = {
+    "largura": (largura, 4),
+    "profundidade": (profundidade, 4),
+    "largura_vetorizada": (largura_vetorizada, 4),
+    "largura_bidirecional": (largura_bidirecional, 4),
+    "a_estrela": (a_estrela, 4),
+    "gulosa": (gulosa, 4),
+    "custo_uniforme": (custo_uniforme, 4),
+    "a_estrela_octil": (a_estrela, 8),
+    "salto": (salto, 8),
+}
+TAMANHOS = (15, 64, 256, 1024, 4096)
+DENSIDADES = (0.0, 0.2)
+
+
+def sorteia_par(mapa, rnd):
+    """Origem e destino distintos e livres, sorteados com ``sorteia_coords``."""
+    while True:
+        origem = int(mapa.indice(*sorteia_coords(mapa, rnd)))
+        destino = int(mapa.indice(*sorteia_coords(mapa, rnd)))
+        if origem != destino and mapa.livre(origem) and mapa.livre(destino):
+            return origem, destino
+
+
+def mede(busca, mapa, origem, destino, memoria=True):
+    inicio = time.perf_counter()
+    resultado = busca(mapa, origem, destino)
+    tempo = time.perf_counter() - inicio
+    pico = None
+    if memoria:
+        tracemalloc.start()
+        busca(mapa, origem, destino)
+        pico = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return {
+        "encontrado": resultado.encontrado,
+        "custo": float(resultado.custo) if resultado.encontrado else None,  # JSON estrito não tem Infinity.
+        "expandidos": int(resultado.expandidos),
+        "fronteira_max": int(resultado.fronteira_max),
+        "tempo": tempo,
+        "expansoes_por_segundo": resultado.expandidos / tempo if tempo else None,
+        "memoria_max": pico,
+    }
+
+
+def executa(tamanhos=TAMANHOS, densidades=DENSIDADES, algoritmos=None, pares=3, semente=0, memoria=True):
+    algoritmos = list(ALGORITMOS) if algoritmos is None else algoritmos
+    medidas = []
+    for tamanho in tamanhos:
+        for densidade in densidades:
+            terreno = obstaculos(tamanho, tamanho, densidade, semente=semente)
+            mapas = {}
+            rnd = np.random.default_rng(semente)
+            for par in [sorteia_par(Mapa(tamanho, tamanho, terreno=terreno), rnd) for _ in range(pares)]:
+                for nome in algoritmos:
+                    busca, vizinhanca = ALGORITMOS[nome]
+                    if vizinhanca not in mapas:
+                        mapas[vizinhanca] = Mapa(tamanho, tamanho, vizinhanca, terreno=terreno)
+                        mapas[vizinhanca].tabela()  # Tabelas fora do tempo medido: são montadas uma vez por mapa.
+                        mapas[vizinhanca].com_moldura()
+                    medida = mede(busca, mapas[vizinhanca], *par, memoria=memoria)
+                    medida.update(algoritmo=nome, tamanho=tamanho, densidade=densidade, origem=par[0], destino=par[1])
+                    medidas.append(medida)
+    return medidas
+
+
+def versoes():
+    try:
+        lab = metadata.version("lab")
+    except metadata.PackageNotFoundError:
+        lab = None
+    return {"lab": lab, "python": platform.python_version(), "numpy": np.__version__}
+
+
+def salva(medidas, arquivo):
+    with open(arquivo, "w") as f:
+        json.dump({"data": datetime.now().isoformat(), "versoes": versoes(), "medidas": medidas}, f, indent=1,
+                  allow_nan=False)
+
+
+if __name__ == "__main__":
+    argumentos = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    argumentos.add_argument("--tamanhos", type=int, nargs="+", default=TAMANHOS)
+    argumentos.add_argument("--densidades", type=float, nargs="+", default=DENSIDADES)
+    argumentos.add_argument("--algoritmos", nargs="+", choices=ALGORITMOS, default=None)
+    argumentos.add_argument("--pares", type=int, default=3)
+    argumentos.add_argument("--semente", type=int, default=0)
+    argumentos.add_argument("--sem-memoria", action="store_true", help="não mede o pico de memória")
+    argumentos.add_argument("--saida", default="benchmark.json")
+    args = argumentos.parse_args()
+    medidas = executa(args.tamanhos, args.densidades, args.algoritmos, args.pares, args.semente, not args.sem_memoria)
+    for m in medidas:
+        print(f"{m['algoritmo']:>22} {m['tamanho']:>5} {m['densidade']:.2f} {m['expandidos']:>10} exp "
+              f"{m['expansoes_por_segundo'] or 0:>12.0f} exp/s {m['fronteira_max']:>8} fronteira {m['tempo']:8.3f}s")
+    salva(medidas, args.saida)
@@ -0,0 +1,95 @@
+from collections import OrderedDict
+
+import numpy as np
+
+from lab.busca.cega import _expande_camada
+from lab.busca.fronteira import ListaAberta
+from lab.busca.mapa import mapa_de
+from lab.busca.resultado import Resultado, SEM_PAI, reconstroi
+
+
+class CampoDeDistancias:
+    """Distâncias de todas as células até um destino, calculadas numa única busca reversa.
+
+    ``proximo[i]`` é o passo seguinte de ``i`` rumo ao destino (``SEM_PAI`` no próprio destino ou se inalcançável),
+    então cada passo de qualquer origem custa O(1). Com ``passos=True``, a distância é o número de movimentos,
+    ignorando custos de terreno e de diagonais.
+    """
+
+    def __init__(self, mapa, destino, passos=False):
+        self.mapa = mapa = mapa_de(mapa)
+        self.destino = destino = mapa.estado(destino)
+        self.versao = mapa.versao
+        self.distancias = np.full(mapa.n, np.inf)
+        self.proximo = np.full(mapa.n, SEM_PAI, dtype=np.int32)
+        self.distancias[destino] = 0
+        self.passos = passos
+        uniforme = mapa.vizinhanca != 8 and (mapa.terreno is None or mapa.terreno.max() <= 1)
+        if passos or uniforme:
+            self._largura()
+        else:
+            self._dijkstra()
+
+    def _largura(self):
+        # Em custo uniforme, o pai na busca em largura reversa já é o próximo passo.
+        visitados = self.mapa.bitmap()
+        visitados[self.destino] = True
+        camada, passos = np.array([self.destino]), 0
+        while camada.size:
+            passos += 1
+            camada = _expande_camada(self.mapa, camada, visitados, self.proximo)
+            self.distancias[camada] = passos
+
+    def _dijkstra(self):
+        aberta = ListaAberta(self.mapa.n)
+        aberta.insere(self.destino, 0.0)
+        while (atual := aberta.retira()) is not None:
+            d = self.distancias[atual]
+            antecessores, custos = self.mapa.transicoes_reversas(atual)
+            for antecessor, custo in zip(antecessores.tolist(), custos.tolist()):
+                if d + custo < self.distancias[antecessor]:
+                    self.distancias[antecessor] = d + custo
+                    self.proximo[antecessor] = atual
+                    aberta.insere(antecessor, d + custo)
+
+    def passo(self, origem):
+        return int(self.proximo[self.mapa.estado(origem)])
+
+    def distancia(self, origem):
+        return float(self.distancias[self.mapa.estado(origem)])
+
+    def caminho(self, origem):
+        origem = self.mapa.estado(origem)
+        if np.isinf(self.distancias[origem]):
+            return Resultado(np.empty(0, dtype=np.int64), np.inf, 0)
+        return Resultado(reconstroi(self.proximo, origem)[::-1], float(self.distancias[origem]), 0)
+
+    def __repr__(self):
+        return f"CampoDeDistancias({self.mapa}, destino={self.mapa.coords(self.destino)})"
+
+
+class CacheDeCampos:
+    """Cache LRU de campos de distância, indexado por (mapa, versão do mapa, destino, passos)."""
+
+    def __init__(self, capacidade=16):
+        self.capacidade = capacidade
+        self.campos = OrderedDict()
+
+    def __call__(self, mapa, destino, passos=False):
+        mapa = mapa_de(mapa)
+        destino = mapa.estado(destino)
+        # O campo guarda referência ao mapa, então o id não é reaproveitado enquanto a entrada existir.
+        chave = id(mapa), mapa.versao, destino, passos
+        if chave in self.campos:
+            self.campos.move_to_end(chave)
+            return self.campos[chave]
+        campo = self.campos[chave] = CampoDeDistancias(mapa, destino, passos)
+        while len(self.campos) > self.capacidade:
+            self.campos.popitem(last=False)
+        return campo
+
+    def __len__(self):
+        return len(self.campos)
+
+
+campo_de_distancias = CacheDeCampos()
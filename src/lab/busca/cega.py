@@ -0,0 +1,112 @@
+import numpy as np
+
+from lab.busca.eventos import EXPANDE, ENFILEIRA
+from lab.busca.fronteira import Fronteira
+from lab.busca.mapa import mapa_de
+from lab.busca.resultado import Resultado, SEM_PAI, cronometra, reconstroi
+
+
+def _expande_camada(mapa, camada, visitados, pais, observador=None):
+    """Gera a próxima camada da busca em largura, marcando visitados e pais; devolve as células novas.
+
+    O ``observador``, se houver, recebe a camada inteira de uma vez em cada evento.
+    """
+    if observador is not None:
+        observador(EXPANDE, camada)
+    origens, destinos = mapa.vizinhos(camada)
+    novos = ~visitados[destinos]
+    origens, destinos = origens[novos], destinos[novos]
+    pais[destinos] = origens
+    # Quando dois pais disputam a mesma célula, só o último escrito permanece; isso deduplica sem ordenar.
+    camada = destinos[pais[destinos] == origens]
+    visitados[camada] = True
+    if observador is not None:
+        observador(ENFILEIRA, camada)
+    return camada
+
+
+@cronometra
+def largura_vetorizada(mapa, origem, destino=None, observador=None):
+    """Busca em largura camada a camada: cada camada inteira é expandida com operações vetoriais."""
+    mapa = mapa_de(mapa)
+    origem = mapa.estado(origem)
+    destino = None if destino is None else mapa.estado(destino)
+    visitados = mapa.bitmap()
+    pais = np.full(mapa.n, SEM_PAI, dtype=np.int32)
+    visitados[origem] = True
+    camada = np.array([origem], dtype=np.int64)
+    expandidos = maximo = 0
+    while camada.size and (destino is None or not visitados[destino]):
+        expandidos += camada.size
+        camada = _expande_camada(mapa, camada, visitados, pais, observador)
+        maximo = max(maximo, camada.size)
+    if destino is None or not visitados[destino]:
+        return Resultado(np.empty(0, dtype=np.int64), np.inf, expandidos, maximo)
+    caminho = reconstroi(pais, destino)
+    return Resultado(caminho, mapa.custo(caminho), expandidos, maximo)
+
+
+@cronometra
+def largura_bidirecional(mapa, origem, destino, observador=None):
+    """Busca em largura vetorizada a partir das duas pontas, até as fronteiras se encontrarem.
+
+    Expande sempre a menor das duas camadas. A primeira célula da nova camada que já foi vista pelo outro lado
+    fecha um caminho mínimo: antes do encontro as duas bolas eram disjuntas, logo nenhum atalho é possível.
+    """
+    mapa = mapa_de(mapa)
+    origem, destino = mapa.estado(origem), mapa.estado(destino)
+    if origem == destino:
+        return Resultado(np.array([origem], dtype=np.int64), 0, 0)
+    visitados = mapa.bitmap(), mapa.bitmap()
+    pais = np.full(mapa.n, SEM_PAI, dtype=np.int32), np.full(mapa.n, SEM_PAI, dtype=np.int32)
+    camadas = [np.array([origem], dtype=np.int64), np.array([destino], dtype=np.int64)]
+    visitados[0][origem] = visitados[1][destino] = True
+    expandidos = maximo = 0
+    while camadas[0].size and camadas[1].size:
+        lado = 0 if camadas[0].size <= camadas[1].size else 1
+        expandidos += camadas[lado].size
+        camadas[lado] = _expande_camada(mapa, camadas[lado], visitados[lado], pais[lado], observador)
+        maximo = max(maximo, camadas[0].size + camadas[1].size)
+        encontro = camadas[lado][visitados[1 - lado][camadas[lado]]]
+        if encontro.size:
+            meio = int(encontro[0])
+            ida, volta = reconstroi(pais[0], meio), reconstroi(pais[1], meio)
+            caminho = np.concatenate([ida, volta[-2::-1]])
+            return Resultado(caminho, mapa.custo(caminho), expandidos, maximo)
+    return Resultado(np.empty(0, dtype=np.int64), np.inf, expandidos, maximo)
+
+
+@cronometra
+def _busca_cega(mapa, origem, destino, lifo, observador):
+    mapa = mapa_de(mapa)
+    origem, destino = mapa.estado(origem), mapa.estado(destino)
+    visitados = mapa.bitmap()
+    pais = np.full(mapa.n, SEM_PAI, dtype=np.int32)
+    fronteira = Fronteira(mapa.n, lifo=lifo)
+    fronteira.insere(origem)
+    expandidos = 0
+    while fronteira:
+        atual = fronteira.retira()
+        visitados[atual] = True
+        if observador is not None:
+            observador(EXPANDE, atual)
+        if atual == destino:
+            caminho = reconstroi(pais, destino)
+            return Resultado(caminho, mapa.custo(caminho), expandidos, fronteira.maximo)
+        expandidos += 1
+        for sucessor in mapa.sucessores(atual).tolist():
+            if not visitados[sucessor] and fronteira.insere(sucessor):
+                pais[sucessor] = atual
+                if observador is not None:
+                    observador(ENFILEIRA, sucessor)
+    return Resultado(np.empty(0, dtype=np.int64), np.inf, expandidos, fronteira.maximo)
+
+
+def largura(mapa, origem, destino, observador=None):
+    """Busca em largura; ``observador(evento, celula)``, se dado, é avisado de cada expansão e inserção."""
+    return _busca_cega(mapa, origem, destino, False, observador)
+
+
+def profundidade(mapa, origem, destino, observador=None):
+    """Busca em profundidade; mesma interface de ``largura``."""
+    return _busca_cega(mapa, origem, destino, True, observador)
@@ -0,0 +1,171 @@
+"""Planejamento cooperativo de muitos agentes numa mesma grade (Windowed Hierarchical Cooperative A*).
+
+Cada agente planeja, em ordem, uma janela de ``janela`` instantes num espaço (célula, instante), evitando as
+reservas dos demais; a distância real até o destino (campo de distâncias em passos) guia a busca e estima o que
+falta depois da janela. Todo agente sempre tem um plano reservado (no início, ficar parado), então planos
+antigos continuam válidos quando o orçamento de tempo acaba antes de todos replanejarem.
+"""
+
+from heapq import heappop, heappush
+from time import perf_counter
+
+import numpy as np
+
+from lab.busca.campo import CampoDeDistancias
+from lab.busca.mapa import mapa_de
+
+
+class TabelaDeReservas:
+    """Qual agente ocupa cada (célula, instante).
+
+    Cada par vira a chave inteira ``instante * n + celula`` num dict; as chaves também ficam agrupadas por instante,
+    para que as reservas do passado sejam descartadas em bloco.
+    """
+
+    def __init__(self, n):
+        self.n = n
+        self.donos = {}
+        self.por_instante = {}
+
+    def reserva(self, celula, instante, agente):
+        chave = instante * self.n + celula
+        self.donos[chave] = agente
+        self.por_instante.setdefault(instante, []).append(chave)
+
+    def dono(self, celula, instante):
+        return self.donos.get(instante * self.n + celula)
+
+    def permite(self, de, para, instante, agente):
+        """Se ``agente`` pode ir de ``de`` para ``para`` entre ``instante`` e o seguinte sem colidir nem trocar de lugar
+        com outro agente."""
+        ocupante = self.dono(para, instante + 1)
+        if ocupante is not None and ocupante != agente:
+            return False
+        vizinho = self.dono(para, instante)
+        return vizinho is None or vizinho == agente or self.dono(de, instante + 1) != vizinho
+
+    def libera(self, celulas, instante, agente):
+        """Retira as reservas de ``agente`` para ``celulas[k]`` no instante ``instante + k``."""
+        for k, celula in enumerate(celulas):
+            chave = (instante + k) * self.n + celula
+            if self.donos.get(chave) == agente:
+                del self.donos[chave]
+
+    def descarta(self, antes):
+        for instante in [i for i in self.por_instante if i < antes]:
+            for chave in self.por_instante.pop(instante):
+                self.donos.pop(chave, None)
+
+    def __len__(self):
+        return len(self.donos)
+
+
+class PlanejadorCooperativo:
+    def __init__(self, mapa, janela=16):
+        self.mapa = mapa_de(mapa)
+        self.janela = janela
+        self.reservas = TabelaDeReservas(self.mapa.n)
+        self.instante = 0
+        self.destinos, self.planos, self.inicios = [], [], []  # O plano do agente k começa no instante inicios[k].
+        self.campos = {}  # Um campo de distâncias (em passos) por destino, compartilhado entre agentes.
+
+    def adiciona(self, origem, destino):
+        """Inclui um agente parado na ``origem``; ele passa a andar quando for planejado. Devolve seu número."""
+        origem, destino = self.mapa.estado(origem), self.mapa.estado(destino)
+        agente = len(self.destinos)
+        plano = []
+        for k in range(self.janela + 1):
+            if self.reservas.dono(origem, self.instante + k) is not None:
+                break
+            plano.append(origem)
+        if not plano:
+            raise ValueError(f"Origem {self.mapa.coords(origem)} já está ocupada.")
+        if destino not in self.campos:
+            self.campos[destino] = CampoDeDistancias(self.mapa, destino, passos=True)
+        self.destinos.append(destino)
+        self.planos.append(plano)
+        self.inicios.append(self.instante)
+        for k, celula in enumerate(plano):
+            self.reservas.reserva(celula, self.instante + k, agente)
+        return agente
+
+    def posicao(self, agente):
+        plano = self.planos[agente]
+        return plano[min(self.instante - self.inicios[agente], len(plano) - 1)]
+
+    def posicoes(self):
+        return np.array([self.posicao(agente) for agente in range(len(self.destinos))], dtype=np.int64)
+
+    def restante(self, agente):
+        return len(self.planos[agente]) - 1 - (self.instante - self.inicios[agente])
+
+    @property
+    def chegaram(self):
+        return self.posicoes() == np.array(self.destinos)
+
+    def planeja(self, orcamento=None):
+        """Replaneja, primeiro, os agentes com menos plano pela frente; devolve quantos foram replanejados.
+
+        Agentes com pelo menos meia janela de plano são deixados como estão. Com ``orcamento`` (segundos), para
+        quando o tempo acaba, exceto pelos agentes a um passo do fim do plano, que sempre são replanejados.
+        """
+        relogio = perf_counter()
+        replanejados = 0
+        for agente in sorted(range(len(self.destinos)), key=self.restante):
+            restante = self.restante(agente)
+            if restante >= self.janela // 2:
+                break
+            if restante > 1 and orcamento is not None and perf_counter() - relogio > orcamento:
+                break
+            self._replaneja(agente)
+            replanejados += 1
+        return replanejados
+
+    def avanca(self):
+        """Passa um instante; cada agente dá o próximo passo do seu plano. Devolve as novas posições."""
+        self.instante += 1
+        self.reservas.descarta(self.instante)
+        return self.posicoes()
+
+    def _replaneja(self, agente):
+        origem, instante = self.posicao(agente), self.instante
+        antigo = self.planos[agente][instante - self.inicios[agente]:]
+        self.reservas.libera(antigo, instante, agente)
+        plano = self._janela(agente, origem, instante)
+        self.planos[agente], self.inicios[agente] = plano, instante
+        for k, celula in enumerate(plano):
+            self.reservas.reserva(celula, instante + k, agente)
+
+    def _janela(self, agente, origem, instante):
+        """A* no espaço (célula, passo da janela); esperar custa 1, exceto parado no destino.
+
+        Termina no primeiro estado que alcança o fim da janela. Se nenhum alcança, usa o mais avançado.
+        """
+        destino, n = self.destinos[agente], self.mapa.n
+        h = self.campos[destino].distancias
+        pais, custos = {origem: None}, {origem: 0}
+        heap = [(h[origem], 0, origem, 0)]
+        melhor = origem
+        while heap:
+            _, menos_passo, celula, g = heappop(heap)
+            passo = -menos_passo
+            estado = passo * n + celula
+            if g > custos[estado]:
+                continue
+            if passo > melhor // n:
+                melhor = estado
+            if passo == self.janela:
+                break
+            for proxima in self.mapa.sucessores(celula).tolist() + [celula]:
+                if not self.reservas.permite(celula, proxima, instante + passo, agente):
+                    continue
+                g_proxima = g + (0 if proxima == celula == destino else 1)
+                seguinte = estado + n - celula + proxima
+                if g_proxima < custos.get(seguinte, np.inf):
+                    custos[seguinte], pais[seguinte] = g_proxima, estado
+                    heappush(heap, (g_proxima + h[proxima], -(passo + 1), proxima, g_proxima))
+        plano = []
+        while melhor is not None:
+            plano.append(melhor % n)
+            melhor = pais[melhor]
+        return plano[::-1]
@@ -0,0 +1,126 @@
+"""Tabela compacta de estados para buscas em espaços de estados grandes (ver ``lab.busca.problema``).
+
+Cada estado é um inteiro de até 64 bits e recebe um índice sequencial; custo, pai e marca de fechado ficam em
+vetores numpy indexados por ele, e achar o índice de um estado é uma sondagem linear num vetor de int32. Cada posição
+da tabela custa 29 bytes; como a capacidade dobra, isso dá de 29 a 58 bytes por estado guardado, contra mais de 150
+num ``dict`` de inteiros Python com os mesmos dados. A conta é só da tabela: a fronteira das buscas de
+``lab.busca.problema`` soma a sua, 4 bytes por estado na fila da largura e cerca de 56 por entrada na lista aberta.
+"""
+
+import numpy as np
+
+from lab.busca.resultado import SEM_PAI
+
+_VAZIO = -1
+_FIBONACCI = 0x9E3779B97F4A7C15  # 2**64 / razão áurea: espalha bem estados que diferem só em poucos bits.
+_MASCARA = (1 << 64) - 1
+_ESTADOS_POR_BLOCO = 1 << 12  # Estados reendereçados por vez ao crescer a tabela.
+
+
+class TabelaDeEstados:
+    """Associa estados a índices e guarda, para cada índice, ``g``, ``pais`` (índice do pai) e ``fechados``.
+
+    Com ``n`` informado, os estados são inteiros densos em ``range(n)`` (como as células de um ``Mapa``) e servem
+    eles mesmos de índice; sem ``n``, são inteiros quaisquer de 64 bits, numerados na ordem de inserção. Os vetores
+    crescem dobrando, então devem ser relidos da tabela depois de cada ``insere``. ``tipo_custo=np.float32`` economiza
+    4 bytes por estado e é exato para custos inteiros até 2**24.
+    """
+
+    def __init__(self, n=None, capacidade=1 << 10, tipo_custo=np.float64):
+        self.n = n
+        tamanho = capacidade if n is None else n
+        self.g = np.full(tamanho, np.inf, dtype=tipo_custo)
+        self.pais = np.full(tamanho, SEM_PAI, dtype=np.int32)
+        self.fechados = np.zeros(tamanho, dtype=bool)
+        self.quantidade = 0
+        if n is None:
+            self.chaves = np.zeros(tamanho, dtype=np.uint64)
+            self.bits = (2 * tamanho - 1).bit_length()  # Ao menos duas posições por estado: ocupação <= 1/2.
+            self.posicoes = np.full(1 << self.bits, _VAZIO, dtype=np.int32)
+
+    def _casa(self, estado):
+        return ((estado * _FIBONACCI) & _MASCARA) >> (64 - self.bits)
+
+    def indice(self, estado):
+        """Índice de ``estado``, ou ``SEM_PAI`` se ele nunca foi inserido."""
+        if self.n is not None:
+            return estado
+        posicoes, chaves, mascara = self.posicoes, self.chaves, len(self.posicoes) - 1
+        p = self._casa(estado)
+        while (i := int(posicoes[p])) != _VAZIO:
+            if int(chaves[i]) == estado:
+                return i
+            p = (p + 1) & mascara
+        return SEM_PAI
+
+    def insere(self, estado):
+        """Índice de ``estado``, inserindo-o (com ``g`` infinito e sem pai) se for novo."""
+        if self.n is not None:
+            return estado
+        if self.quantidade == len(self.chaves):
+            self._cresce()
+        posicoes, chaves, mascara = self.posicoes, self.chaves, len(self.posicoes) - 1
+        p = self._casa(estado)
+        while (i := int(posicoes[p])) != _VAZIO:
+            if int(chaves[i]) == estado:
+                return i
+            p = (p + 1) & mascara
+        i = self.quantidade
+        chaves[i] = estado
+        posicoes[p] = i
+        self.quantidade += 1
+        return i
+
+    def estado(self, i):
+        return i if self.n is not None else int(self.chaves[i])
+
+    def estados(self, indices):
+        """Versão vetorizada de ``estado``."""
+        return indices if self.n is not None else self.chaves[indices]
+
+    def _cresce(self):
+        tamanho = 2 * len(self.chaves)
+        self.g = np.concatenate([self.g, np.full(tamanho - len(self.g), np.inf, dtype=self.g.dtype)])
+        self.pais = np.concatenate([self.pais, np.full(tamanho - len(self.pais), SEM_PAI, dtype=np.int32)])
+        self.fechados = np.concatenate([self.fechados, np.zeros(tamanho - len(self.fechados), dtype=bool)])
+        self.chaves = np.concatenate([self.chaves, np.zeros(tamanho - len(self.chaves), dtype=np.uint64)])
+        self.bits += 1
+        self._espalha()
+
+    def _espalha(self):
+        """Refaz o endereçamento de todos os estados, de forma vetorizada e em blocos, para limitar os temporários.
+
+        Em cada rodada, cada estado pendente do bloco tenta a posição em que está; se ela estiver livre, o primeiro
+        candidato a ocupa e os demais avançam uma posição. Como nada é removido, as posições puladas por um estado
+        continuam ocupadas, e a sondagem linear de ``indice`` o encontra.
+        """
+        self.posicoes = None  # Libera o endereçamento antigo antes de alocar o novo.
+        self.posicoes = np.full(1 << self.bits, _VAZIO, dtype=np.int32)
+        mascara = len(self.posicoes) - 1
+        for inicio in range(0, self.quantidade, _ESTADOS_POR_BLOCO):
+            fim = min(inicio + _ESTADOS_POR_BLOCO, self.quantidade)
+            pendentes = np.arange(inicio, fim, dtype=np.int32)
+            casas = (self.chaves[inicio:fim] * np.uint64(_FIBONACCI)) >> np.uint64(64 - self.bits)
+            casas = casas.astype(np.int64)
+            while len(pendentes):
+                candidatos = np.flatnonzero(self.posicoes[casas] == _VAZIO)
+                _, primeiros = np.unique(casas[candidatos], return_index=True)
+                ocupam = candidatos[primeiros]
+                self.posicoes[casas[ocupam]] = pendentes[ocupam]
+                restantes = np.ones(len(pendentes), dtype=bool)
+                restantes[ocupam] = False
+                pendentes, casas = pendentes[restantes], (casas[restantes] + 1) & mascara
+
+    @property
+    def memoria(self):
+        """Bytes ocupados pelos vetores da tabela."""
+        vetores = [self.g, self.pais, self.fechados]
+        if self.n is None:
+            vetores += [self.chaves, self.posicoes]
+        return sum(v.nbytes for v in vetores)
+
+    def __len__(self):
+        return self.quantidade if self.n is None else self.n
+
+    def __repr__(self):
+        return f"TabelaDeEstados({len(self)} estados, {self.memoria / 2**20:.1f} MiB)"
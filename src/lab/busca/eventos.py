@@ -0,0 +1,8 @@
+# Códigos dos eventos repassados ao ``observador(evento, celula)`` opcional das buscas.
+# As buscas vetorizadas passam um vetor de células por evento em vez de uma só.
+EXPANDE = 0
+ENFILEIRA = 1
+VISITA = 2  # Célula percorrida pelo agente no caminho encontrado.
+
+# Cor de cada evento nas visualizações, na ordem em que uma mesma célula costuma passar por eles.
+CORES = {ENFILEIRA: "lightgreen", EXPANDE: "blue", VISITA: "orange"}
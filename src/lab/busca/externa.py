@@ -0,0 +1,203 @@
+"""Busca em largura em memória externa, para espaços de estados que não cabem na RAM.
+
+Segue a detecção atrasada de duplicatas de Korf: cada camada fica em disco como um vetor ordenado de estados. A
+camada seguinte é gerada aos blocos, lidos da atual por ``np.memmap``; cada bloco de sucessores vira uma sequência
+ordenada em disco, e as sequências são intercaladas num único vetor ordenado, sem repetições. Como as transições
+são reversíveis (grades e quebra-cabeças o são), um sucessor da camada ``k`` só pode repetir estados das camadas
+``k - 1`` e ``k``, então basta compará-lo com elas. A memória usada é da ordem de ``bloco`` estados.
+
+Ao fim de cada camada, o estado da busca é gravado em ``diretorio/estado.json``; uma nova ``LarguraExterna`` no
+mesmo diretório (e com o mesmo ``bloco``) retoma dali, e a expansão de uma camada interrompida pula os blocos já
+gravados.
+"""
+
+import json
+import os
+
+import numpy as np
+
+from lab.busca.eventos import EXPANDE, ENFILEIRA
+from lab.busca.mapa import Mapa, mapa_de
+from lab.busca.resultado import Resultado, cronometra
+
+
+def _grava(caminho, dados):
+    """Grava de forma atômica: um arquivo pela metade nunca aparece com o nome final."""
+    with open(caminho + ".tmp", "wb") as arquivo:
+        arquivo.write(dados)
+        arquivo.flush()
+        os.fsync(arquivo.fileno())
+    os.replace(caminho + ".tmp", caminho)
+
+
+class LarguraExterna:
+    """Busca em largura de ``origem`` a ``destino`` (ou exaustiva, se ``destino`` for ``None``), com camadas em disco.
+
+    ``espaco`` é um ``Mapa`` (ou ``Grade``), cujos vizinhos são calculados do terreno, sem montar a tabela CSR, ou um
+    ``Problema``, cujos estados são inteiros de 64 bits e cujo ``vizinhos`` convém ser vetorizado.
+    """
+
+    def __init__(self, espaco, origem, destino, diretorio, bloco=1 << 20):
+        self.espaco = mapa_de(espaco)
+        self.em_grade = isinstance(self.espaco, Mapa)
+        if self.em_grade:
+            origem = self.espaco.estado(origem)
+            destino = None if destino is None else self.espaco.estado(destino)
+        self.tipo = np.dtype(np.int64 if self.em_grade else np.uint64)
+        self.origem, self.destino = int(origem), None if destino is None else int(destino)
+        self.diretorio = diretorio
+        self.bloco = bloco
+        os.makedirs(diretorio, exist_ok=True)
+        # ``bloco`` define quais linhas da camada vão para cada ``seq_{i}``; retomar com outro misturaria sequências.
+        self.progresso = {"origem": self.origem, "destino": self.destino, "tipo": self.tipo.name, "bloco": bloco,
+                          "tamanhos": [1], "expandidos": 0, "fim": False}
+        arquivo = os.path.join(diretorio, "estado.json")
+        if os.path.exists(arquivo):
+            with open(arquivo) as f:
+                salvo = json.load(f)
+            if any(salvo.get(chave) != self.progresso[chave] for chave in ("origem", "destino", "tipo", "bloco")):
+                raise ValueError(f"{diretorio} guarda outra busca; use um diretório novo.")
+            self.progresso = salvo
+            # Sobras de uma interrupção: só as sequências da camada em construção ainda servem.
+            for nome in os.listdir(diretorio):
+                k = nome.split(".")[0].removeprefix("camada_")
+                if nome.endswith(".tmp") or (".seq_" in nome and int(k) <= self.profundidade):
+                    os.remove(os.path.join(diretorio, nome))
+        else:
+            _grava(self._arquivo(0), np.array([self.origem], dtype=self.tipo).tobytes())
+            self._salva_estado()
+
+    @property
+    def profundidade(self):
+        """Índice da última camada completa."""
+        return len(self.progresso["tamanhos"]) - 1
+
+    @property
+    def tamanhos(self):
+        return self.progresso["tamanhos"]
+
+    def _arquivo(self, k, sequencia=None):
+        nome = f"camada_{k}.bin" if sequencia is None else f"camada_{k}.seq_{sequencia}.bin"
+        return os.path.join(self.diretorio, nome)
+
+    def _salva_estado(self):
+        _grava(os.path.join(self.diretorio, "estado.json"), json.dumps(self.progresso).encode())
+
+    def camada(self, k):
+        """Estados da camada ``k``, ordenados, lidos sob demanda do disco."""
+        return self._le(self._arquivo(k))
+
+    def _le(self, caminho):
+        if os.path.getsize(caminho) == 0:
+            return np.empty(0, dtype=self.tipo)  # ``np.memmap`` não aceita arquivos vazios.
+        return np.memmap(caminho, dtype=self.tipo, mode="r")
+
+    def _vizinhos(self, estados):
+        if self.em_grade:
+            contagens, vizinhos, _ = self.espaco.arestas(estados)
+            return np.repeat(estados, contagens), vizinhos
+        return self.espaco.vizinhos(estados)
+
+    def _contem(self, camada, estados):
+        """Quais dos ``estados`` (ordenados) estão na ``camada``, por busca binária direto no arquivo."""
+        if len(camada) == 0:
+            return np.zeros(len(estados), dtype=bool)
+        posicoes = np.minimum(np.searchsorted(camada, estados), len(camada) - 1)
+        return camada[posicoes] == estados
+
+    def _expande(self, observador):
+        """Grava uma sequência ordenada de sucessores por bloco da última camada; devolve os arquivos."""
+        k = self.profundidade
+        atual = self.camada(k)
+        sequencias = []
+        for i, inicio in enumerate(range(0, len(atual), self.bloco)):
+            sequencias.append(self._arquivo(k + 1, i))
+            if os.path.exists(sequencias[-1]):
+                continue  # Já gravada antes de uma interrupção.
+            estados = np.asarray(atual[inicio:inicio + self.bloco])
+            if observador is not None:
+                observador(EXPANDE, estados)
+            _, sucessores = self._vizinhos(estados)
+            _grava(sequencias[-1], np.unique(sucessores.astype(self.tipo)).tobytes())
+        return sequencias
+
+    def _intercala(self, sequencias, observador):
+        """Intercala as sequências numa camada ordenada, sem repetições nem estados das duas camadas anteriores."""
+        k = self.profundidade
+        anteriores = [self.camada(k)] + ([self.camada(k - 1)] if k > 0 else [])
+        sequencias = [s for s in (self._le(arquivo) for arquivo in sequencias) if len(s)]
+        posicoes = [0] * len(sequencias)
+        passo = max(1024, self.bloco // max(1, len(sequencias)))
+        tamanho, achou = 0, False
+        with open(self._arquivo(k + 1) + ".tmp", "wb") as saida:
+            while sequencias:
+                trechos = [s[p:p + passo] for s, p in zip(sequencias, posicoes)]
+                # Todo estado até o pivô já foi lido de todas as sequências, então o trecho até ele está completo.
+                pivo = min(t[-1] for t in trechos)
+                partes = []
+                for i, trecho in enumerate(trechos):
+                    fim = np.searchsorted(trecho, pivo, side="right")
+                    partes.append(trecho[:fim])
+                    posicoes[i] += fim
+                novos = np.unique(np.concatenate(partes))
+                for anterior in anteriores:
+                    novos = novos[~self._contem(anterior, novos)]
+                novos.tofile(saida)
+                tamanho += len(novos)
+                achou = achou or (self.destino is not None and bool(np.any(novos == self.destino)))
+                if observador is not None and len(novos):
+                    observador(ENFILEIRA, novos)
+                restantes = [i for i, s in enumerate(sequencias) if posicoes[i] < len(s)]
+                sequencias, posicoes = [sequencias[i] for i in restantes], [posicoes[i] for i in restantes]
+            saida.flush()
+            os.fsync(saida.fileno())
+        os.replace(self._arquivo(k + 1) + ".tmp", self._arquivo(k + 1))
+        return tamanho, achou
+
+    @cronometra
+    def executa(self, observador=None):
+        """Avança camada a camada até achar o destino ou esgotar o espaço; devolve o ``Resultado``."""
+        while not self.progresso["fim"]:
+            if self.destino is not None and self.destino == self.origem:
+                self.progresso["fim"] = True
+                break
+            sequencias = self._expande(observador)
+            tamanho, achou = self._intercala(sequencias, observador)
+            self.progresso["expandidos"] += self.tamanhos[-1]
+            if tamanho:
+                self.tamanhos.append(tamanho)
+            self.progresso["fim"] = achou or tamanho == 0
+            self._salva_estado()
+            for arquivo in sequencias:
+                os.remove(arquivo)
+        expandidos, maximo = self.progresso["expandidos"], max(self.tamanhos)
+        ultima = self.camada(self.profundidade)
+        if self.destino is None or not self._contem(ultima, np.array([self.destino], dtype=self.tipo))[0]:
+            return Resultado(np.empty(0, dtype=self.tipo), np.inf, expandidos, maximo)
+        caminho = self.caminho(self.destino, self.profundidade)
+        return Resultado(caminho, self.custo(caminho), expandidos, maximo)
+
+    def custo(self, caminho):
+        """Custo de percorrer ``caminho``; a busca minimiza passos, mas o custo é o das transições."""
+        if self.em_grade:
+            return self.espaco.custo(caminho)
+        estados = caminho.tolist()
+        return float(sum(self.espaco.custo(a, b) for a, b in zip(estados, estados[1:])))
+
+    def caminho(self, estado, k):
+        """Caminho da origem até ``estado``, da camada ``k``: a cada passo, um vizinho que esteja na camada anterior."""
+        caminho = np.empty(k + 1, dtype=self.tipo)
+        caminho[k] = estado
+        for j in range(k - 1, -1, -1):
+            _, vizinhos = self._vizinhos(caminho[j + 1:j + 2])
+            vizinhos = np.sort(vizinhos.astype(self.tipo))
+            caminho[j] = vizinhos[self._contem(self.camada(j), vizinhos)][0]
+        return caminho
+
+    def __repr__(self):
+        return f"LarguraExterna({self.diretorio!r}, {self.profundidade + 1} camadas, {sum(self.tamanhos)} estados)"
+
+
+def largura_externa(espaco, origem, destino, diretorio, bloco=1 << 20, observador=None):
+    """Atalho para ``LarguraExterna(...).executa()``; retoma a busca se ``diretorio`` já tiver uma em andamento."""
+    return LarguraExterna(espaco, origem, destino, diretorio, bloco).executa(observador)
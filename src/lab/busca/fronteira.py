@@ -0,0 +1,94 @@
+from collections import deque
+from heapq import heappop, heappush
+
+import numpy as np
+
+
+class Fronteira:
+    """Fila (FIFO) ou pilha (LIFO) com teste de pertinência O(1).
+
+    Com ``n`` informado, os estados são índices de célula e a pertinência fica num bitmap de ``n`` posições;
+    sem ``n``, qualquer estado hasheável é aceito e a pertinência fica num ``set``.
+    """
+
+    def __init__(self, n=None, lifo=False):
+        self.lifo = lifo
+        self.fila = deque()
+        self.maximo = 0
+        self.bitmap = None if n is None else np.zeros(n, dtype=bool)
+        self.conjunto = set() if n is None else None
+
+    def insere(self, x):
+        """Insere ``x`` se ainda não estiver na fronteira; devolve se houve inserção."""
+        if x in self:
+            return False
+        self.fila.append(x)
+        if self.bitmap is None:
+            self.conjunto.add(x)
+        else:
+            self.bitmap[x] = True
+        if len(self.fila) > self.maximo:
+            self.maximo = len(self.fila)
+        return True
+
+    def retira(self):
+        x = self.fila.pop() if self.lifo else self.fila.popleft()
+        if self.bitmap is None:
+            self.conjunto.discard(x)
+        else:
+            self.bitmap[x] = False
+        return x
+
+    def __contains__(self, x):
+        if self.bitmap is None:
+            return x in self.conjunto
+        return bool(self.bitmap[x])
+
+    def __len__(self):
+        return len(self.fila)
+
+    def __repr__(self):
+        return f"Fronteira({'LIFO' if self.lifo else 'FIFO'}, {len(self)} estados)"
+
+
+class ListaAberta:
+    """Lista aberta das buscas informadas: heap binário sem decrease-key.
+
+    Ao melhorar a prioridade de um estado, basta reinseri-lo; a entrada antiga fica no heap e é descartada ao sair,
+    pois o estado já terá sido fechado. Empates em ``f`` são desfeitos pelo menor ``h``, isto é, pelo estado mais
+    próximo do destino.
+    """
+
+    def __init__(self, n=None):
+        self.heap = []
+        self.maximo = 0
+        self.bitmap = None if n is None else np.zeros(n, dtype=bool)
+        self.conjunto = set() if n is None else None
+
+    def insere(self, x, f, h=0.0):
+        heappush(self.heap, (f, h, x))
+        if len(self.heap) > self.maximo:
+            self.maximo = len(self.heap)
+
+    def retira(self):
+        """Fecha e devolve o estado de menor prioridade que ainda não foi fechado, ou ``None`` se não houver."""
+        while self.heap:
+            _, _, x = heappop(self.heap)
+            if not self.fechado(x):
+                if self.bitmap is None:
+                    self.conjunto.add(x)
+                else:
+                    self.bitmap[x] = True
+                return x
+        return None
+
+    def fechado(self, x):
+        if self.bitmap is None:
+            return x in self.conjunto
+        return bool(self.bitmap[x])
+
+    def __len__(self):
+        return len(self.heap)  # Inclui entradas obsoletas ainda não descartadas.
+
+    def __repr__(self):
+        return f"ListaAberta({len(self)} entradas)"
@@ -1,20 +1,36 @@
 import turtle
 from time import sleep, time
 
-from lab.busca import Alvo
+import numpy as np
+
+from lab.busca import Alvo, Mapa
+from lab.busca.eventos import CORES, EXPANDE
+from lab.busca.mapa import BLOQUEADO
 
 
 class Grade:
+    """Visualização de um ``Mapa`` com turtle.
+
+    ``pinta`` só anota a célula como suja; ``desenha`` carimba todas as sujas de uma vez e atualiza a tela.
+    Com ``a_cada=N``, apenas uma a cada N chamadas de ``desenha`` vira quadro (as demais apenas acumulam), e
+    ``fps=None`` dispensa a espera entre quadros.
+    """
+
     alvo: Alvo
 
-    def __init__(self, nlinhas=15, ncolunas=15, tamanho_do_no=30, fps=10):
+    def __init__(self, nlinhas=15, ncolunas=15, tamanho_do_no=30, fps=10, mapa=None, a_cada=1):
+        # A grade é apenas uma visualização de um Mapa; as buscas operam diretamente sobre o Mapa.
+        self.mapa = Mapa(nlinhas, ncolunas) if mapa is None else mapa
+        nlinhas, ncolunas = self.mapa.nlinhas, self.mapa.ncolunas
         self.tamanho_do_no, self.nlinhas, self.ncolunas = tamanho_do_no, nlinhas, ncolunas
         width = ncolunas * tamanho_do_no + 100
         height = nlinhas * tamanho_do_no + 100
         self.screen = turtle.Screen()
         self.screen.setup(width, height)
         self.screen.tracer(0, 0)
-        self.fps = fps
+        self.fps, self.a_cada, self.chamadas = fps, a_cada, 0
+        self.sujas = {}
+        self.carimbos = {}
         self.grid = turtle.Turtle()
         self.grid.hideturtle()
         self.grid.speed(0)
@@ -26,41 +42,65 @@ class Grade:
         xf = self.xi + ncolunas * tamanho_do_no
         yf = self.yi + nlinhas * tamanho_do_no
 
-        for x in range(self.xi, xf + 1, tamanho_do_no):
-            self.grid.penup()
-            self.grid.goto(x, self.yi)
-            self.grid.pendown()
-            self.grid.goto(x, yf)
+        # Um único traço em zigue-zague cobre todas as linhas da grade; as idas e vindas caem sobre a borda.
+        self.grid.penup()
+        self.grid.goto(self.xi, self.yi)
+        self.grid.pendown()
+        for k, x in enumerate(range(self.xi, xf + 1, tamanho_do_no)):
+            self.grid.goto(x, self.yi if k % 2 == 0 else yf)
+            self.grid.goto(x, yf if k % 2 == 0 else self.yi)
+        # O traço vertical termina em ``xf``, embaixo se o número de colunas for ímpar e em cima se for par.
+        ys = range(self.yi, yf + 1, tamanho_do_no)
+        for k, y in enumerate(ys if ncolunas % 2 else reversed(ys)):
+            self.grid.goto(xf if k % 2 == 0 else self.xi, y)
+            self.grid.goto(self.xi if k % 2 == 0 else xf, y)
 
-        for y in range(self.yi, yf + 1, tamanho_do_no):
-            self.grid.penup()
-            self.grid.goto(self.xi, y)
-            self.grid.pendown()
-            self.grid.goto(xf, y)
-
-        self.pincel = turtle.Turtle()
+        self.pincel = turtle.Turtle(shape="square")
         self.pincel.hideturtle()
         self.pincel.speed(0)
+        self.pincel.penup()
+        self.pincel.shapesize(tamanho_do_no / 20, tamanho_do_no / 20, 1)
+        if self.mapa.terreno is not None:
+            for i in np.flatnonzero(self.mapa.terreno == BLOQUEADO):
+                self.pinta(*self.mapa.coords(i), cor="black")
+        self.descarrega()
         self.screen.update()
 
-    def desenha(self):
-        espera = 1 / self.fps - (time() - self.inicio)
-        if espera > 0:
-            sleep(espera)
+    def desenha(self, forca=False):
+        self.chamadas += 1
+        if not forca and self.chamadas % self.a_cada:
+            return
+        if self.fps:
+            espera = 1 / self.fps - (time() - self.inicio)
+            if espera > 0:
+                sleep(espera)
         self.inicio = time()
+        self.descarrega()
         self.alvo.recolore()
         self.screen.update()
 
     def pinta(self, l, c, cor):
-        self.pincel.penup()
-        self.pincel.goto(self(l + 0.5, c - 0.5))
-        self.pincel.pendown()
-        self.pincel.fillcolor(cor)
-        self.pincel.begin_fill()
-        for _ in range(4):
-            self.pincel.forward(self.tamanho_do_no)
-            self.pincel.left(90)
-        self.pincel.end_fill()
+        self.sujas[l, c] = cor
+
+    def descarrega(self):
+        """Carimba as células sujas; o carimbo anterior de cada célula é apagado para não acumular itens na tela."""
+        for (l, c), cor in self.sujas.items():
+            if (l, c) in self.carimbos:
+                self.pincel.clearstamp(self.carimbos[l, c])
+            self.pincel.goto(self(l, c))
+            self.pincel.color("lightgray", cor)
+            self.carimbos[l, c] = self.pincel.stamp()
+        self.sujas.clear()
+
+    def observa(self, evento, celulas):
+        """Observador pronto para as buscas; aceita uma célula ou um vetor delas (buscas vetorizadas).
+
+        Pinta as células com a cor do evento e desenha a cada expansão.
+        """
+        for celula in np.atleast_1d(celulas).tolist():
+            self.pinta(*self.mapa.coords(celula), cor=CORES[evento])
+        if evento == EXPANDE:
+            self.desenha()
 
     def __call__(self, linha, coluna):
         x = self.xi + (coluna - 0.5) * self.tamanho_do_no
@@ -0,0 +1,41 @@
+import numpy as np
+
+RAIZ2 = np.sqrt(2)
+
+
+def _deltas(mapa, a, b):
+    la, ca = divmod(a, mapa.ncolunas)
+    lb, cb = divmod(b, mapa.ncolunas)
+    return abs(la - lb), abs(ca - cb)
+
+
+# Todas as heurísticas recebem índices de células e aceitam tanto inteiros quanto vetores de índices.
+
+def nula(mapa, a, b):
+    return 0 * a
+
+
+def manhattan(mapa, a, b):
+    dl, dc = _deltas(mapa, a, b)
+    return dl + dc
+
+
+def octil(mapa, a, b):
+    """Distância com movimentos diagonais de custo √2; admissível em grades de 4 e 8 vizinhos."""
+    dl, dc = _deltas(mapa, a, b)
+    return dl + dc + (RAIZ2 - 2) * np.minimum(dl, dc)
+
+
+def hexagonal(mapa, a, b):
+    """Distância em passos numa grade hexagonal com linhas ímpares deslocadas (``Mapa(vizinhanca=6)``)."""
+    la, ca = divmod(a, mapa.ncolunas)
+    lb, cb = divmod(b, mapa.ncolunas)
+    # Converte para coordenadas cúbicas (x, y, z), com x + y + z = 0.
+    xa, xb = ca - (la - (la & 1)) // 2, cb - (lb - (lb & 1)) // 2
+    dx, dz = xa - xb, la - lb
+    return np.maximum(np.maximum(abs(dx), abs(dz)), abs(dx + dz))
+
+
+def padrao(mapa):
+    """Heurística admissível natural para a vizinhança do mapa."""
+    return {4: manhattan, 8: octil, 6: hexagonal}[mapa.vizinhanca]
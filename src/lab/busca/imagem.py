@@ -0,0 +1,57 @@
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.colors import to_rgb
+
+from lab.busca.eventos import CORES, EXPANDE
+from lab.busca.mapa import BLOQUEADO, mapa_de
+
+
+class Imagem:
+    """Visualização de um ``Mapa`` como imagem RGB exibida com ``imshow``, para grades grandes demais para turtle.
+
+    Tem a mesma interface de pintura da ``Grade`` (``pinta``, ``desenha``, ``observa``), mas cada célula é um pixel
+    de uma matriz NumPy e ``pinta_celulas`` pinta vetores inteiros de índices de uma vez.
+    """
+
+    def __init__(self, mapa, a_cada=1000, fps=None, eixo=None):
+        self.mapa = mapa = mapa_de(mapa)
+        self.a_cada, self.fps, self.chamadas = a_cada, fps, 0
+        self.pixels = np.full((mapa.nlinhas, mapa.ncolunas, 3), 255, dtype=np.uint8)
+        if mapa.terreno is not None:
+            self.pixels.reshape(-1, 3)[mapa.terreno == BLOQUEADO] = 0
+        self.cores = {}
+        self.eixo = plt.subplots()[1] if eixo is None else eixo
+        self.eixo.set_axis_off()
+        self.quadro = self.eixo.imshow(self.pixels, interpolation="nearest")
+
+    def rgb(self, cor):
+        if cor not in self.cores:
+            self.cores[cor] = np.array(to_rgb(cor)) * 255
+        return self.cores[cor]
+
+    def pinta(self, l, c, cor):
+        self.pixels[l - 1, c - 1] = self.rgb(cor)
+
+    def pinta_celulas(self, celulas, cor):
+        self.pixels.reshape(-1, 3)[celulas] = self.rgb(cor)
+
+    def aplica(self, registro):
+        """Pinta de uma vez um bloco de pares (evento, célula), como os gravados por ``Rastro``."""
+        for evento, cor in CORES.items():
+            self.pinta_celulas(registro[registro[:, 0] == evento, 1], cor)
+
+    def desenha(self, forca=False):
+        self.chamadas += 1
+        if not forca and self.chamadas % self.a_cada:
+            return
+        self.quadro.set_data(self.pixels)
+        plt.pause(1 / self.fps if self.fps else 0.001)
+
+    def observa(self, evento, celulas):
+        """Observador pronto para as buscas; aceita uma célula ou um vetor delas."""
+        self.pinta_celulas(celulas, CORES[evento])
+        if evento == EXPANDE:
+            self.desenha()
+
+    def salva(self, arquivo):
+        plt.imsave(arquivo, self.pixels)
@@ -0,0 +1,145 @@
+from heapq import heapify, heappop, heappush
+
+import numpy as np
+
+from lab.busca.eventos import EXPANDE
+from lab.busca.heuristicas import padrao
+from lab.busca.mapa import mapa_de
+from lab.busca.resultado import Resultado, cronometra
+
+
+def _antes(a, b):
+    """``a < b`` para chaves ``(f, g)``, com ``f`` quase iguais tratados como empate.
+
+    Somas de custos em ordens diferentes diferem no último bit; sem a tolerância, um estado com o mesmo ``f`` do
+    destino e ``g`` menor pode parecer vir depois dele, e a busca pararia sem consertá-lo.
+    """
+    if abs(a[0] - b[0]) <= 1e-9 * max(1.0, abs(b[0])):
+        return a[1] < b[1]
+    return a[0] < b[0]
+
+
+class PlanejadorIncremental:
+    """Replanejamento incremental com LPA* (Lifelong Planning A*), enraizado na origem (o agente).
+
+    Os valores ``g`` e ``rhs`` sobrevivem entre chamadas de ``planeja``. Quando células mudam (``atualiza``) ou o
+    destino se move (``muda_destino``), só os estados afetados voltam à fila, e o replanejamento custa
+    proporcionalmente à região que mudou. Os vizinhos vêm da tabela do mapa como estava na criação do planejador;
+    para as células alteradas desde então (e seus vizinhos), vêm de ``Mapa.arestas``, para que alterar o terreno
+    não exija remontar a tabela do mapa inteiro.
+    """
+
+    def __init__(self, mapa, origem, destino, heuristica=None, observador=None):
+        self.mapa = mapa = mapa_de(mapa)
+        self.destino = mapa.estado(destino)
+        self.heuristica = padrao(mapa) if heuristica is None else heuristica
+        self.observador = observador
+        self.tabela, self.alteradas = mapa.tabela(), set()
+        self._reinicia(mapa.estado(origem))
+
+    def _reinicia(self, origem):
+        self.origem = origem
+        self.g = np.full(self.mapa.n, np.inf)
+        self.rhs = np.full(self.mapa.n, np.inf)
+        self.rhs[origem] = 0.0
+        self.heap, self.chaves, self.vizinhos = [], {}, {}
+        self._insere(origem)
+
+    def _chave(self, s):
+        m = min(self.g[s], self.rhs[s])
+        return m + self.heuristica(self.mapa, s, self.destino), m
+
+    def _insere(self, s):
+        chave = self.chaves[s] = self._chave(s)
+        heappush(self.heap, (chave, s))
+
+    def _topo(self):
+        # Entradas cuja chave não é mais a vigente ficaram obsoletas e são descartadas aqui.
+        while self.heap:
+            chave, s = self.heap[0]
+            if self.chaves.get(s) == chave:
+                return chave, s
+            heappop(self.heap)
+        return (np.inf, np.inf), None
+
+    def _vizinhanca(self, s):
+        if s not in self.vizinhos:
+            if s in self.alteradas:
+                _, vizinhos, direcoes = self.mapa.arestas([s])
+            else:
+                inicios, indices, direcoes = self.tabela
+                vizinhos, direcoes = indices[inicios[s]:inicios[s + 1]], direcoes[inicios[s]:inicios[s + 1]]
+            self.vizinhos[s] = vizinhos.tolist(), self.mapa.custos_direcao[direcoes].tolist()
+        return self.vizinhos[s]
+
+    def _atualiza_vertice(self, u):
+        if u != self.origem:
+            vizinhos, custos = self._vizinhanca(u)
+            fator = 1 if self.mapa.terreno is None else int(self.mapa.terreno[u])  # Custo de entrar em u.
+            self.rhs[u] = min((self.g[p] + c * fator for p, c in zip(vizinhos, custos)), default=np.inf)
+        self.chaves.pop(u, None)
+        if self.g[u] != self.rhs[u]:
+            self._insere(u)
+
+    @cronometra
+    def planeja(self):
+        """Repara os valores até o destino ficar consistente e devolve o caminho atual como ``Resultado``."""
+        expandidos, maximo, destino = 0, len(self.chaves), self.destino
+        while True:
+            chave, u = self._topo()
+            if u is None or not (_antes(chave, self._chave(destino)) or self.rhs[destino] != self.g[destino]):
+                break
+            heappop(self.heap)
+            del self.chaves[u]
+            expandidos += 1
+            if self.observador is not None:
+                self.observador(EXPANDE, u)
+            vizinhos, _ = self._vizinhanca(u)
+            if self.g[u] > self.rhs[u]:
+                self.g[u] = self.rhs[u]
+            else:
+                self.g[u] = np.inf
+                self._atualiza_vertice(u)
+            for s in vizinhos:
+                self._atualiza_vertice(s)
+            maximo = max(maximo, len(self.chaves))
+        return Resultado(self._caminho(), float(self.g[destino]), expandidos, maximo)
+
+    def _caminho(self):
+        if np.isinf(self.g[self.destino]):
+            return np.empty(0, dtype=np.int64)
+        caminho = [self.destino]
+        while caminho[-1] != self.origem:
+            u = caminho[-1]
+            vizinhos, custos = self._vizinhanca(u)
+            fator = 1 if self.mapa.terreno is None else int(self.mapa.terreno[u])
+            caminho.append(min(zip(vizinhos, custos), key=lambda pc: self.g[pc[0]] + pc[1] * fator)[0])
+        return np.array(caminho[::-1], dtype=np.int64)
+
+    def atualiza(self, celulas_alteradas, valores=None):
+        """Avisa que o terreno das células mudou (ou o muda, se ``valores`` for dado); ``planeja`` conserta o resto.
+
+        Mudar uma célula altera as arestas que entram e saem dela e, em 8 vizinhos, as diagonais que contornam sua
+        quina; todas têm como extremidade a própria célula ou um vizinho geométrico dela.
+        """
+        celulas = np.atleast_1d(celulas_alteradas)
+        if valores is not None:
+            self.mapa.altera(celulas, valores)
+        _, geometricos, _ = self.mapa.arestas(celulas, com_terreno=False)
+        afetadas = set(celulas.tolist()) | set(geometricos.tolist())
+        self.alteradas |= afetadas
+        for s in afetadas:
+            self.vizinhos.pop(s, None)
+        for s in afetadas:
+            self._atualiza_vertice(s)
+
+    def muda_destino(self, destino):
+        """Move o destino: ``g`` e ``rhs`` continuam válidos, só as chaves da fila são recalculadas."""
+        self.destino = self.mapa.estado(destino)
+        self.chaves = {s: self._chave(s) for s in self.chaves}
+        self.heap = [(chave, s) for s, chave in self.chaves.items()]
+        heapify(self.heap)
+
+    def muda_origem(self, origem):
+        """Move a raiz da busca; como ``g`` é a distância desde a origem, isso recomeça o planejamento do zero."""
+        self._reinicia(self.mapa.estado(origem))
@@ -0,0 +1,56 @@
+import numpy as np
+
+from lab.busca.eventos import EXPANDE, ENFILEIRA
+from lab.busca.fronteira import ListaAberta
+from lab.busca.heuristicas import nula, padrao
+from lab.busca.mapa import mapa_de
+from lab.busca.resultado import Resultado, SEM_PAI, cronometra, reconstroi
+
+
+@cronometra
+def melhor_primeiro(mapa, origem, destino, heuristica=None, peso_g=1.0, peso_h=1.0, observador=None):
+    """Busca de melhor escolha com prioridade ``f = peso_g * g + peso_h * h``.
+
+    ``a_estrela``, ``gulosa`` e ``custo_uniforme`` são casos particulares dos pesos. Por padrão, ``heuristica`` é a
+    admissível natural da vizinhança do mapa (Manhattan superestima em grades de 8 vizinhos e hexagonais).
+    """
+    mapa = mapa_de(mapa)
+    origem, destino = mapa.estado(origem), mapa.estado(destino)
+    heuristica = padrao(mapa) if heuristica is None else heuristica
+    g = np.full(mapa.n, np.inf)
+    pais = np.full(mapa.n, SEM_PAI, dtype=np.int32)
+    aberta = ListaAberta(mapa.n)
+    g[origem] = 0.0
+    h = heuristica(mapa, origem, destino)
+    aberta.insere(origem, peso_h * h, h)
+    expandidos = 0
+    while (atual := aberta.retira()) is not None:
+        if observador is not None:
+            observador(EXPANDE, atual)
+        if atual == destino:
+            return Resultado(reconstroi(pais, destino), float(g[destino]), expandidos, aberta.maximo)
+        expandidos += 1
+        g_atual = g[atual]
+        sucessores, custos = mapa.transicoes(atual)
+        for sucessor, custo in zip(sucessores.tolist(), custos.tolist()):
+            novo = g_atual + custo
+            if novo < g[sucessor] and not aberta.fechado(sucessor):
+                g[sucessor] = novo
+                pais[sucessor] = atual
+                h = heuristica(mapa, sucessor, destino)
+                aberta.insere(sucessor, peso_g * novo + peso_h * h, h)
+                if observador is not None:
+                    observador(ENFILEIRA, sucessor)
+    return Resultado(np.empty(0, dtype=np.int64), np.inf, expandidos, aberta.maximo)
+
+
+def a_estrela(mapa, origem, destino, heuristica=None, observador=None):
+    return melhor_primeiro(mapa, origem, destino, heuristica, observador=observador)
+
+
+def gulosa(mapa, origem, destino, heuristica=None, observador=None):
+    return melhor_primeiro(mapa, origem, destino, heuristica, peso_g=0.0, observador=observador)
+
+
+def custo_uniforme(mapa, origem, destino, observador=None):
+    return melhor_primeiro(mapa, origem, destino, nula, peso_h=0.0, observador=observador)
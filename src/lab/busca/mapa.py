@@ -0,0 +1,202 @@
+import numpy as np
+
+DIRECOES = {"norte": (1, 0), "sul": (-1, 0), "oeste": (0, 1), "leste": (0, -1)}
+DIAGONAIS = {"nordeste": (1, -1), "noroeste": (1, 1), "sudeste": (-1, -1), "sudoeste": (-1, 1)}
+
+# Deslocamentos (linha, coluna) para linhas pares e ímpares; só a vizinhança hexagonal ("odd-r") depende da paridade.
+_ORTOGONAIS = list(DIRECOES.values())
+_OCTOGONAIS = _ORTOGONAIS + list(DIAGONAIS.values())
+DESLOCAMENTOS = {
+    4: (_ORTOGONAIS, _ORTOGONAIS),
+    8: (_OCTOGONAIS, _OCTOGONAIS),
+    6: ([(0, -1), (0, 1), (-1, -1), (-1, 0), (1, -1), (1, 0)], [(0, -1), (0, 1), (-1, 0), (-1, 1), (1, 0), (1, 1)]),
+}
+# Custo de cada direção, na mesma ordem dos deslocamentos.
+CUSTOS_DIRECAO = {4: np.ones(4), 8: np.array([1.0] * 4 + [np.sqrt(2)] * 4), 6: np.ones(6)}
+_CELULAS_POR_BLOCO = 1 << 18
+BLOQUEADO = 0  # Valor de terreno das células intransponíveis; os demais valores são o custo de entrar na célula.
+
+
+class Mapa:
+    """Grade sem interface gráfica.
+
+    Cada estado é o índice inteiro da célula, em ordem de linhas: ``(linha - 1) * ncolunas + (coluna - 1)``,
+    com linhas e colunas numeradas a partir de 1 como na ``Grade``.
+    A vizinhança pode ser 4, 8 ou 6 (hexagonal, linhas ímpares deslocadas meia célula).
+    Os vizinhos ficam numa tabela CSR, montada uma única vez no primeiro uso.
+
+    O ``terreno`` opcional é uma matriz uint8 ``(nlinhas, ncolunas)``: ``BLOQUEADO`` (0) marca obstáculos e qualquer
+    outro valor é o custo de entrar na célula. Sem terreno, todas as células são livres e de custo 1.
+    Em 8 vizinhos, a diagonal só é permitida se as duas células ortogonais que ela contorna estiverem livres.
+    """
+
+    def __init__(self, nlinhas=15, ncolunas=15, vizinhanca=4, terreno=None):
+        if vizinhanca not in DESLOCAMENTOS:
+            raise ValueError(f"Vizinhança deve ser 4, 8 ou 6, não {vizinhanca}.")
+        if terreno is not None:
+            if terreno.dtype != np.uint8 or terreno.shape != (nlinhas, ncolunas):
+                raise ValueError(f"Terreno deve ser uint8 {(nlinhas, ncolunas)}, não {terreno.dtype} {terreno.shape}.")
+            terreno = terreno.reshape(-1)  # Sem cópia, inclusive para np.memmap.
+        self.nlinhas, self.ncolunas, self.vizinhanca = nlinhas, ncolunas, vizinhanca
+        self.n = nlinhas * ncolunas
+        self.terreno = terreno
+        self.custos_direcao = CUSTOS_DIRECAO[vizinhanca]
+        self.versao = 0  # Incrementada a cada alteração do terreno; identifica resultados que ficaram obsoletos.
+        self._tabela = None
+        self._moldura = None
+
+    @classmethod
+    def carrega(cls, arquivo, vizinhanca=4, modo="r"):
+        """Abre um terreno salvo com ``salva`` mapeando o arquivo em memória, sem copiá-lo para a RAM.
+
+        ``modo`` é o do ``np.memmap``: ``"r"`` só permite leitura, ``"r+"`` grava as alterações de ``altera`` no
+        arquivo e ``"c"`` as mantém só na memória (cópia na escrita).
+        """
+        terreno = np.load(arquivo, mmap_mode=modo)
+        return cls(*terreno.shape, vizinhanca=vizinhanca, terreno=terreno)
+
+    def salva(self, arquivo):
+        terreno = np.ones(self.n, dtype=np.uint8) if self.terreno is None else self.terreno
+        np.save(arquivo, terreno.reshape(self.nlinhas, self.ncolunas))
+
+    def altera(self, celulas, valores):
+        """Muda o terreno das ``celulas`` (índices) para ``valores``; a tabela de vizinhos é remontada depois."""
+        if self.terreno is None:
+            self.terreno = np.ones(self.n, dtype=np.uint8)
+        if not self.terreno.flags.writeable:
+            raise ValueError('Terreno somente leitura; abra-o com Mapa.carrega(..., modo="r+") ou modo="c".')
+        self.terreno[celulas] = valores
+        self.versao += 1
+        self._tabela = self._moldura = None
+
+    def livre(self, i):
+        return self.terreno is None or self.terreno[i] != BLOQUEADO
+
+    def indice(self, linha, coluna):
+        return (linha - 1) * self.ncolunas + coluna - 1
+
+    def coords(self, i):
+        linha, coluna = divmod(int(i), self.ncolunas)
+        return linha + 1, coluna + 1
+
+    def estado(self, x):
+        """Converte índice, par (linha, coluna) ou objeto com ``linha``/``coluna`` (Agente, Alvo) em índice."""
+        if isinstance(x, (int, np.integer)):
+            return int(x)
+        if hasattr(x, "linha"):
+            return self.indice(x.linha, x.coluna)
+        return self.indice(*x)
+
+    def bitmap(self):
+        return np.zeros(self.n, dtype=bool)
+
+    def tabela(self):
+        """Tabela CSR ``(inicios, indices, direcoes)``: os vizinhos de ``i`` são ``indices[inicios[i]:inicios[i + 1]]``.
+
+        ``direcoes`` guarda, para cada aresta, a posição do deslocamento usado (e, portanto, seu custo).
+        """
+        if self._tabela is None:
+            self._tabela = self._monta_tabela()
+        return self._tabela
+
+    def arestas(self, celulas, com_terreno=True):
+        """Arestas de um vetor de células, calculadas da geometria e do terreno atual, sem usar a tabela.
+
+        Devolve ``(contagens, vizinhos, direcoes)``, com os vizinhos em ordem de célula e de direção, como na tabela.
+        Com ``com_terreno=False``, ignora obstáculos e devolve todos os vizinhos geométricos.
+        """
+        pares, impares = (np.array(d) for d in DESLOCAMENTOS[self.vizinhanca])
+        L, C = np.divmod(np.asarray(celulas)[:, None], self.ncolunas)
+        deslocamentos = np.where((L & 1)[:, :, None] == 1, impares, pares)
+        l, c = L + deslocamentos[..., 0], C + deslocamentos[..., 1]
+        validos = (0 <= l) & (l < self.nlinhas) & (0 <= c) & (c < self.ncolunas)
+        if com_terreno and self.terreno is not None:
+            l, c = np.where(validos, l, L), np.where(validos, c, C)  # Evita índices fora da grade.
+
+            def livre(linha, coluna):
+                return self.terreno[linha * self.ncolunas + coluna] != BLOQUEADO
+
+            validos &= livre(L, C) & livre(l, c)
+            if self.vizinhanca == 8:
+                diagonais = (l != L) & (c != C)
+                validos &= ~diagonais | (livre(l, C) & livre(L, c))
+        return validos.sum(axis=1), (l * self.ncolunas + c)[validos], np.nonzero(validos)[1]
+
+    def _monta_tabela(self):
+        contagens, indices, direcoes = [], [], []
+        for inicio in range(0, self.n, _CELULAS_POR_BLOCO):
+            bloco = self.arestas(np.arange(inicio, min(inicio + _CELULAS_POR_BLOCO, self.n)))
+            for lista, parte in zip((contagens, indices, direcoes), bloco):
+                lista.append(parte)
+        contagens = np.concatenate(contagens)
+        tipo = np.int32 if contagens.sum() < np.iinfo(np.int32).max else np.int64
+        inicios = np.zeros(self.n + 1, dtype=tipo)
+        np.cumsum(contagens, out=inicios[1:])
+        indices = np.concatenate(indices).astype(np.int32 if self.n < np.iinfo(np.int32).max else np.int64)
+        return inicios, indices, np.concatenate(direcoes).astype(np.uint8)
+
+    def com_moldura(self):
+        """Bytes ``(nlinhas + 2) x (ncolunas + 2)`` com 1 nas células livres, cercados por uma moldura bloqueada.
+
+        A moldura dispensa testes de limite em laços que andam célula a célula (ex.: Jump Point Search).
+        """
+        if self._moldura is None:
+            moldura = np.zeros((self.nlinhas + 2, self.ncolunas + 2), dtype=np.uint8)
+            if self.terreno is None:
+                moldura[1:-1, 1:-1] = 1
+            else:
+                moldura[1:-1, 1:-1] = (self.terreno != BLOQUEADO).reshape(self.nlinhas, self.ncolunas)
+            self._moldura = moldura.tobytes()
+        return self._moldura
+
+    def vizinhos(self, celulas):
+        """Pares (origem, vizinho) para um vetor de células, lidos em bloco da tabela CSR."""
+        inicios, indices, _ = self.tabela()
+        celulas = np.asarray(celulas)
+        primeiros = inicios[celulas]
+        contagens = inicios[celulas + 1] - primeiros
+        # Posição de cada aresta na tabela: início do bloco da célula mais o deslocamento dentro do bloco.
+        posicoes = np.arange(contagens.sum()) + np.repeat(primeiros - np.cumsum(contagens) + contagens, contagens)
+        return np.repeat(celulas, contagens), indices[posicoes]
+
+    def sucessores(self, i):
+        inicios, indices, _ = self.tabela()
+        return indices[inicios[i]:inicios[i + 1]]
+
+    def transicoes(self, i):
+        """Sucessores de ``i`` e o custo de cada movimento."""
+        inicios, indices, direcoes = self.tabela()
+        a, b = inicios[i], inicios[i + 1]
+        sucessores, custos = indices[a:b], self.custos_direcao[direcoes[a:b]]
+        if self.terreno is not None:
+            custos = custos * self.terreno[sucessores]
+        return sucessores, custos
+
+    def transicoes_reversas(self, i):
+        """Antecessores de ``i`` e o custo do movimento de cada um deles até ``i``."""
+        inicios, indices, direcoes = self.tabela()
+        a, b = inicios[i], inicios[i + 1]
+        antecessores, custos = indices[a:b], self.custos_direcao[direcoes[a:b]]
+        if self.terreno is not None:
+            custos = custos * self.terreno[i]
+        return antecessores, custos
+
+    def custo(self, caminho):
+        """Custo de percorrer ``caminho``, uma sequência de índices de células vizinhas."""
+        caminho = np.asarray(caminho, dtype=np.int64)
+        a, b = caminho[:-1], caminho[1:]
+        custos = np.ones(len(b))
+        if self.vizinhanca == 8:
+            diagonais = (a // self.ncolunas != b // self.ncolunas) & (a % self.ncolunas != b % self.ncolunas)
+            custos[diagonais] = self.custos_direcao[-1]
+        if self.terreno is not None:
+            custos *= self.terreno[b]
+        return float(custos.sum())
+
+    def __repr__(self):
+        return f"Mapa({self.nlinhas}, {self.ncolunas}, vizinhanca={self.vizinhanca})"
+
+
+def mapa_de(x):
+    """Aceita tanto um ``Mapa`` quanto uma ``Grade`` (que carrega seu ``Mapa``)."""
+    return getattr(x, "mapa", x)
@@ -0,0 +1,109 @@
+"""Caminhadas aleatórias em massa, vetorizadas, com a mesma regra de ``algbusca/aleatoria.py``.
+
+A cada passo o caminhante sorteia, com probabilidade uniforme, um vizinho que ele ainda não visitou; o episódio
+termina ao chegar no destino ou quando não há vizinho novo. Os episódios são processados em lotes: cada lote
+avança todos os seus caminhantes juntos, com um bitmap de visitados por caminhante e seu próprio gerador,
+derivado da semente com ``SeedSequence.spawn``, então o resultado não depende de quantos processos foram usados.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+
+from lab.busca.mapa import mapa_de
+
+_BYTES_POR_LOTE = 1 << 27
+
+
+class Estatisticas:
+    """Número de passos de cada episódio até o destino, com ``-1`` nos que ficaram presos."""
+
+    def __init__(self, passos):
+        self.passos = passos
+
+    @property
+    def episodios(self):
+        return len(self.passos)
+
+    @property
+    def acertos(self):
+        return int((self.passos >= 0).sum())
+
+    @property
+    def taxa_de_acerto(self):
+        return self.acertos / self.episodios if self.episodios else np.nan
+
+    @property
+    def tempos(self):
+        """Passos até o destino, só dos episódios que chegaram."""
+        return self.passos[self.passos >= 0]
+
+    def media(self):
+        return float(self.tempos.mean()) if self.acertos else np.nan
+
+    def quantis(self, q=(0.05, 0.25, 0.5, 0.75, 0.95)):
+        return np.quantile(self.tempos, q) if self.acertos else np.full(len(q), np.nan)
+
+    def __repr__(self):
+        return (f"Estatisticas(episodios={self.episodios}, taxa_de_acerto={self.taxa_de_acerto:.4f}, "
+                f"media={self.media():.2f})")
+
+
+def vizinhos_densos(mapa):
+    """Tabela ``(n, k)`` de vizinhos a partir da CSR do mapa, completada com -1; permite indexar vários de uma vez."""
+    inicios, indices, _ = mapa.tabela()
+    contagens = np.diff(inicios)
+    densos = np.full((mapa.n, max(1, contagens.max())), -1, dtype=np.int32)
+    linhas = np.repeat(np.arange(mapa.n), contagens)
+    densos[linhas, np.arange(len(indices)) - inicios[linhas]] = indices
+    return densos
+
+
+def _lote(vizinhos, origem, destino, episodios, semente):
+    rnd = np.random.default_rng(semente)
+    passos = np.zeros(episodios, dtype=np.int32)
+    if origem == destino:
+        return passos
+    posicoes = np.full(episodios, origem, dtype=np.int64)
+    visitados = np.zeros((episodios, len(vizinhos)), dtype=bool)
+    visitados[:, origem] = True
+    chegou = np.zeros(episodios, dtype=bool)
+    ativos = np.arange(episodios)
+    while ativos.size:
+        candidatos = vizinhos[posicoes[ativos]]
+        novos = (candidatos >= 0) & ~visitados[ativos[:, None], np.maximum(candidatos, 0)]
+        # Sorteio uniforme entre os vizinhos novos: maior chave aleatória, com -1 nos inválidos.
+        escolhas = np.where(novos, rnd.random(novos.shape), -1.0).argmax(axis=1)
+        livres = novos.any(axis=1)
+        ativos, candidatos, escolhas = ativos[livres], candidatos[livres], escolhas[livres]
+        proximos = candidatos[np.arange(ativos.size), escolhas]
+        posicoes[ativos] = proximos
+        visitados[ativos, proximos] = True
+        passos[ativos] += 1
+        fim = proximos == destino
+        chegou[ativos[fim]] = True
+        ativos = ativos[~fim]
+    return np.where(chegou, passos, -1)
+
+
+def caminhadas(mapa, origem, destino, episodios=100_000, semente=0, lote=None, processos=None):
+    """Roda ``episodios`` caminhadas aleatórias de ``origem`` a ``destino`` e devolve suas ``Estatisticas``.
+
+    ``lote`` limita quantos caminhantes avançam juntos (por padrão, o que cabe em ~128 MiB de bitmaps);
+    com ``processos``, os lotes são distribuídos num ``ProcessPoolExecutor``.
+    """
+    mapa = mapa_de(mapa)
+    origem, destino = mapa.estado(origem), mapa.estado(destino)
+    if episodios == 0:
+        return Estatisticas(np.empty(0, dtype=np.int32))
+    lote = lote or max(1, min(episodios, _BYTES_POR_LOTE // mapa.n))
+    tamanhos = [min(lote, episodios - inicio) for inicio in range(0, episodios, lote)]
+    sementes = np.random.SeedSequence(semente).spawn(len(tamanhos))
+    tarefa = partial(_lote, vizinhos_densos(mapa), origem, destino)
+    if processos is None:
+        partes = list(map(tarefa, tamanhos, sementes))
+    else:
+        with ProcessPoolExecutor(processos) as executor:
+            partes = list(executor.map(tarefa, tamanhos, sementes))
+    return Estatisticas(np.concatenate(partes))
@@ -0,0 +1,186 @@
+"""Buscas sobre espaços de estados quaisquer, descritos por um ``Problema``.
+
+As grades são um caso particular (``ProblemaDeGrade``); para elas, os motores de ``cega`` e ``informada`` continuam
+mais rápidos, pois trabalham direto sobre os vetores do ``Mapa``. Os daqui servem para qualquer problema cujos
+estados caibam em inteiros de 64 bits, como o ``QuebraCabeca``, e guardam tudo numa ``TabelaDeEstados``.
+
+A fronteira também é compacta: a fila da busca em largura é um vetor int32 de índices da tabela, e cada entrada da
+lista aberta é um único inteiro que empacota ``(f, h, índice)``, em vez de uma tupla com três objetos Python.
+"""
+
+import struct
+from heapq import heappop, heappush
+
+import numpy as np
+
+from lab.busca.estados import TabelaDeEstados
+from lab.busca.eventos import EXPANDE, ENFILEIRA
+from lab.busca.heuristicas import padrao
+from lab.busca.mapa import mapa_de
+from lab.busca.resultado import Resultado, cronometra, reconstroi
+
+
+class Problema:
+    """Protocolo de problema de busca: subclasses definem ``inicial``, ``sucessores`` e ``objetivo``.
+
+    Os estados são inteiros não negativos de até 64 bits, normalmente o estado "de verdade" empacotado bit a bit.
+    ``custo`` (1 por padrão) e ``heuristica`` (nula por padrão) são opcionais, e ``transicoes`` pode ser
+    sobrescrita para gerar sucessores e custos de uma vez. Se os estados forem densos em ``range(n)``, declare ``n``
+    e eles indexarão vetores diretamente, sem hash.
+    """
+
+    n = None
+    inicial = None
+
+    def sucessores(self, estado):
+        raise NotImplementedError
+
+    def objetivo(self, estado):
+        raise NotImplementedError
+
+    def custo(self, estado, sucessor):
+        return 1
+
+    def heuristica(self, estado):
+        return 0
+
+    def transicoes(self, estado):
+        """Sucessores de ``estado`` e os custos para chegar a cada um."""
+        sucessores = list(self.sucessores(estado))
+        return sucessores, [self.custo(estado, s) for s in sucessores]
+
+    def vizinhos(self, estados):
+        """Pares (estado, sucessor) para um vetor uint64 de estados; sobrescreva com uma versão vetorizada."""
+        pares = [(x, s) for x in estados.tolist() for s in self.sucessores(x)]
+        return np.array(pares, dtype=np.uint64).reshape(-1, 2).T
+
+
+class ProblemaDeGrade(Problema):
+    """Ir de ``origem`` a ``destino`` num ``Mapa``; os estados são os índices das células."""
+
+    def __init__(self, mapa, origem, destino, heuristica=None):
+        self.mapa = mapa_de(mapa)
+        self.n = self.mapa.n
+        self.inicial, self.destino = self.mapa.estado(origem), self.mapa.estado(destino)
+        self.h = padrao(self.mapa) if heuristica is None else heuristica
+
+    def sucessores(self, estado):
+        return self.mapa.sucessores(estado).tolist()
+
+    def transicoes(self, estado):
+        sucessores, custos = self.mapa.transicoes(estado)
+        return sucessores.tolist(), custos.tolist()
+
+    def objetivo(self, estado):
+        return estado == self.destino
+
+    def heuristica(self, estado):
+        return self.h(self.mapa, estado, self.destino)
+
+
+_DOUBLE, _FLOAT = struct.Struct("<d"), struct.Struct("<f")
+_NATURAL64, _NATURAL32 = struct.Struct("<Q"), struct.Struct("<I")
+_INDICE = (1 << 32) - 1
+
+
+def _chave(f, h, i):
+    """Inteiro que se ordena como a tupla ``(f, h, i)``, para ``f`` e ``h`` não negativos.
+
+    Os bits de um float não negativo se ordenam como o próprio número; ``h`` só desempata e vai em precisão simples.
+    """
+    f = _NATURAL64.unpack(_DOUBLE.pack(f))[0]
+    h = _NATURAL32.unpack(_FLOAT.pack(h))[0]
+    return f << 64 | h << 32 | i
+
+
+def _resultado(tabela, final, expandidos, maximo):
+    if final is None:
+        return Resultado(np.empty(0, dtype=np.int64), np.inf, expandidos, maximo)
+    return Resultado(tabela.estados(reconstroi(tabela.pais, final)), float(tabela.g[final]), expandidos, maximo)
+
+
+@cronometra
+def largura(problema, tabela=None, observador=None):
+    """Busca em largura; ``tabela``, se dada, é a ``TabelaDeEstados`` a usar (e fica disponível depois)."""
+    tabela = TabelaDeEstados(problema.n) if tabela is None else tabela
+    inicial = tabela.insere(problema.inicial)
+    tabela.g[inicial] = 0
+    fila = np.empty(1024, dtype=np.int32)  # Cada estado entra uma única vez; ``fila[inicio:fim]`` está pendente.
+    fila[0], inicio, fim = inicial, 0, 1
+    expandidos, maximo = 0, 1
+    while inicio < fim:
+        atual = int(fila[inicio])
+        inicio += 1
+        estado = tabela.estado(atual)
+        if observador is not None:
+            observador(EXPANDE, estado)
+        if problema.objetivo(estado):
+            return _resultado(tabela, atual, expandidos, maximo)
+        expandidos += 1
+        g = float(tabela.g[atual])
+        for sucessor, custo in zip(*problema.transicoes(estado)):
+            i = tabela.insere(sucessor)
+            if tabela.g[i] == np.inf:
+                tabela.g[i] = g + custo
+                tabela.pais[i] = atual
+                if fim == len(fila):
+                    # Descarta o trecho já retirado; só dobra o vetor se a parte pendente ocupar mais da metade.
+                    pendentes = fim - inicio
+                    if 2 * pendentes > len(fila):
+                        fila = np.concatenate([fila[inicio:], np.empty(len(fila), dtype=np.int32)])
+                    else:
+                        fila[:pendentes] = fila[inicio:fim]
+                    inicio, fim = 0, pendentes
+                fila[fim] = i
+                fim += 1
+                if observador is not None:
+                    observador(ENFILEIRA, sucessor)
+        maximo = max(maximo, fim - inicio)
+    return _resultado(tabela, None, expandidos, maximo)
+
+
+@cronometra
+def melhor_primeiro(problema, peso_g=1.0, peso_h=1.0, tabela=None, observador=None):
+    """Busca de melhor escolha com prioridade ``f = peso_g * g + peso_h * h``, como a de ``informada``."""
+    tabela = TabelaDeEstados(problema.n) if tabela is None else tabela
+    inicial = tabela.insere(problema.inicial)
+    tabela.g[inicial] = 0
+    h = problema.heuristica(problema.inicial) if peso_h else 0
+    aberta = [_chave(peso_h * h, h, inicial)]
+    expandidos, maximo = 0, 1
+    while aberta:
+        atual = heappop(aberta) & _INDICE
+        if tabela.fechados[atual]:
+            continue  # Entrada obsoleta: o estado foi reinserido com prioridade melhor e já saiu.
+        tabela.fechados[atual] = True
+        estado = tabela.estado(atual)
+        if observador is not None:
+            observador(EXPANDE, estado)
+        if problema.objetivo(estado):
+            return _resultado(tabela, atual, expandidos, maximo)
+        expandidos += 1
+        g = float(tabela.g[atual])
+        for sucessor, custo in zip(*problema.transicoes(estado)):
+            i = tabela.insere(sucessor)
+            novo = g + custo
+            if novo < tabela.g[i] and not tabela.fechados[i]:
+                tabela.g[i] = novo
+                tabela.pais[i] = atual
+                h = problema.heuristica(sucessor) if peso_h else 0
+                heappush(aberta, _chave(peso_g * novo + peso_h * h, h, i))
+                if observador is not None:
+                    observador(ENFILEIRA, sucessor)
+        maximo = max(maximo, len(aberta))
+    return _resultado(tabela, None, expandidos, maximo)
+
+
+def a_estrela(problema, tabela=None, observador=None):
+    return melhor_primeiro(problema, tabela=tabela, observador=observador)
+
+
+def gulosa(problema, tabela=None, observador=None):
+    return melhor_primeiro(problema, peso_g=0.0, tabela=tabela, observador=observador)
+
+
+def custo_uniforme(problema, tabela=None, observador=None):
+    return melhor_primeiro(problema, peso_h=0.0, tabela=tabela, observador=observador)
@@ -0,0 +1,117 @@
+import numpy as np
+
+from lab.busca.problema import Problema
+
+
+class QuebraCabeca(Problema):
+    """Quebra-cabeça deslizante (o 8-puzzle é 3 × 3, o 15-puzzle é 4 × 4), com até 16 casas.
+
+    ``pecas`` é uma matriz (ou sequência, se o tabuleiro for quadrado) com as peças de 1 a N-1 e 0 no espaço vazio.
+    O estado empacota o tabuleiro num inteiro com 4 bits por casa: a casa ``k`` (em ordem de linhas) ocupa os bits
+    ``4k`` a ``4k + 3``. Por padrão, o objetivo é 1, 2, ..., N-1 seguidos do vazio.
+    """
+
+    def __init__(self, pecas, objetivo=None):
+        pecas = np.asarray(pecas)
+        if pecas.ndim == 1:
+            lado = int(np.sqrt(len(pecas)))
+            pecas = pecas.reshape(lado, lado)
+        self.nlinhas, self.ncolunas = pecas.shape
+        casas = pecas.size
+        if casas > 16:
+            raise ValueError(f"O tabuleiro tem {casas} casas; com 4 bits por casa, cabem no máximo 16.")
+        if objetivo is None:
+            objetivo = np.roll(np.arange(casas), -1)
+        self.inicial = self.codifica(pecas)
+        self.final = self.codifica(objetivo)
+        self.uns = int("1" * casas, 16)  # Um 1 em cada casa, para achar o vazio sem percorrer o tabuleiro.
+        self.altos = self.uns << 3
+        # ``self.alvos[d, k]``: casa vizinha de ``k`` na direção ``d``, ou -1 fora do tabuleiro.
+        self.alvos = np.full((4, casas), -1, dtype=np.int64)
+        for d, (dl, dc) in enumerate(((-1, 0), (1, 0), (0, -1), (0, 1))):
+            for k in range(casas):
+                l, c = divmod(k, self.ncolunas)
+                if 0 <= l + dl < self.nlinhas and 0 <= c + dc < self.ncolunas:
+                    self.alvos[d, k] = (l + dl) * self.ncolunas + c + dc
+        self.casas_vizinhas = [[int(x) for x in self.alvos[:, k] if x >= 0] for k in range(casas)]
+        # Manhattan por byte: ``self.distancias[b][v]`` soma as distâncias das peças do byte ``b`` se ele vale ``v``.
+        destino = np.empty(casas, dtype=int)
+        destino[np.asarray(objetivo).ravel()] = np.arange(casas)
+        peca, casa = np.arange(16)[:, None], np.arange(casas)[None, :]
+        distancia = (abs(destino[peca % casas] // self.ncolunas - casa // self.ncolunas)
+                     + abs(destino[peca % casas] % self.ncolunas - casa % self.ncolunas))
+        distancia[0] = 0
+        distancia[casas:] = 0
+        distancia = np.pad(distancia, ((0, 0), (0, casas % 2)))
+        byte = np.arange(256)
+        self.distancias = [(distancia[byte & 15, 2 * b] + distancia[byte >> 4, 2 * b + 1]).tolist()
+                           for b in range((casas + 1) // 2)]
+
+    @staticmethod
+    def codifica(pecas):
+        estado = 0
+        for k, peca in enumerate(np.asarray(pecas).ravel().tolist()):
+            estado |= peca << (4 * k)
+        return estado
+
+    def decodifica(self, estado):
+        estado = int(estado)
+        return np.array([(estado >> (4 * k)) & 15 for k in range(self.nlinhas * self.ncolunas)]).reshape(
+            self.nlinhas, self.ncolunas)
+
+    def vazio(self, estado):
+        """Casa do espaço vazio: o nibble nulo é o primeiro que "empresta" ao subtrair 1 de cada casa."""
+        marcas = (estado - self.uns) & ~estado & self.altos
+        return (marcas & -marcas).bit_length() // 4 - 1
+
+    def sucessores(self, estado):
+        vazio = self.vazio(estado)
+        sucessores = []
+        for casa in self.casas_vizinhas[vazio]:
+            peca = (estado >> (4 * casa)) & 15
+            sucessores.append(estado - (peca << (4 * casa)) + (peca << (4 * vazio)))
+        return sucessores
+
+    def vizinhos(self, estados):
+        """Pares (estado, sucessor) para um vetor uint64 de estados, com operações de bits vetorizadas."""
+        estados = np.asarray(estados, dtype=np.uint64)
+        quatro, quinze = np.uint64(4), np.uint64(15)
+        vazios = np.zeros(len(estados), dtype=np.uint64)
+        for k in range(1, self.nlinhas * self.ncolunas):
+            vazios[((estados >> np.uint64(4 * k)) & quinze) == 0] = k
+        origens, destinos = [], []
+        for alvos in self.alvos:
+            casas = alvos[vazios]
+            validos = casas >= 0
+            origem, vazio, casa = estados[validos], vazios[validos], casas[validos].astype(np.uint64)
+            peca = (origem >> (quatro * casa)) & quinze
+            origens.append(origem)
+            destinos.append(origem - (peca << (quatro * casa)) + (peca << (quatro * vazio)))
+        return np.concatenate(origens), np.concatenate(destinos)
+
+    def transicoes(self, estado):
+        sucessores = self.sucessores(estado)
+        return sucessores, [1] * len(sucessores)
+
+    def objetivo(self, estado):
+        return estado == self.final
+
+    def heuristica(self, estado):
+        """Soma das distâncias de Manhattan de cada peça até a sua casa no objetivo."""
+        nbytes = len(self.distancias)
+        return sum(d[b] for d, b in zip(self.distancias, estado.to_bytes(nbytes, "little")))
+
+    def resolvivel(self):
+        """Se o objetivo é alcançável: a paridade da permutação deve ser a da distância percorrida pelo vazio."""
+        inicial, final = self.decodifica(self.inicial).ravel(), self.decodifica(self.final).ravel()
+        permutacao = np.argsort(final)[inicial]  # Casa de destino da peça que está em cada casa.
+        ciclos, visitadas = 0, np.zeros(len(permutacao), dtype=bool)
+        for k in range(len(permutacao)):
+            if not visitadas[k]:
+                ciclos += 1
+                while not visitadas[k]:
+                    visitadas[k] = True
+                    k = permutacao[k]
+        li, ci = divmod(self.vazio(self.inicial), self.ncolunas)
+        lf, cf = divmod(self.vazio(self.final), self.ncolunas)
+        return (len(permutacao) - ciclos) % 2 == (abs(li - lf) + abs(ci - cf)) % 2
@@ -0,0 +1,80 @@
+import numpy as np
+from matplotlib.animation import PillowWriter
+
+from lab.busca.eventos import VISITA
+from lab.busca.imagem import Imagem
+
+
+class Rastro:
+    """Gravador de eventos de busca, para visualizar depois o que a busca fez.
+
+    É um observador: passe-o como ``observador=`` a qualquer busca, que roda então sem nenhum desenho.
+    Cada evento vira um par int32 (código do evento, índice da célula) num vetor que cresce por duplicação.
+    """
+
+    def __init__(self, capacidade=1024):
+        self.eventos = np.empty((capacidade, 2), dtype=np.int32)
+        self.n = 0
+
+    def _reserva(self, k):
+        if self.n + k > len(self.eventos):
+            maior = np.empty((max(2 * len(self.eventos), self.n + k), 2), dtype=np.int32)
+            maior[:self.n] = self.eventos[:self.n]
+            self.eventos = maior
+
+    def __call__(self, evento, celulas):
+        if np.ndim(celulas) == 0:
+            self._reserva(1)
+            self.eventos[self.n] = evento, celulas
+            self.n += 1
+            return
+        self._reserva(len(celulas))
+        self.eventos[self.n:self.n + len(celulas), 0] = evento
+        self.eventos[self.n:self.n + len(celulas), 1] = celulas
+        self.n += len(celulas)
+
+    def percorre(self, resultado):
+        """Registra o caminho de um ``Resultado`` como eventos ``VISITA``."""
+        self(VISITA, resultado.caminho)
+
+    @property
+    def registro(self):
+        return self.eventos[:self.n]
+
+    def salva(self, arquivo):
+        """Salva em ``.npy`` (só os eventos) ou, para qualquer outra extensão, em ``.npz`` comprimido."""
+        if str(arquivo).endswith(".npy"):
+            np.save(arquivo, self.registro)
+        else:
+            np.savez_compressed(arquivo, eventos=self.registro)
+
+    @classmethod
+    def carrega(cls, arquivo):
+        registro = np.load(arquivo)
+        if not isinstance(registro, np.ndarray):
+            registro = registro["eventos"]
+        rastro = cls(max(1, len(registro)))
+        rastro.eventos[:len(registro)] = registro
+        rastro.n = len(registro)
+        return rastro
+
+    def reproduz(self, visualizacao):
+        """Repassa os eventos, um a um, ao ``observa`` de uma ``Grade`` ou ``Imagem``; a velocidade é a dela."""
+        for evento, celula in self.registro.tolist():
+            visualizacao.observa(evento, celula)
+        visualizacao.desenha(forca=True)
+
+    def gif(self, mapa, arquivo, eventos_por_quadro=100, fps=20):
+        imagem = Imagem(mapa)
+        escritor = PillowWriter(fps=fps)
+        with escritor.saving(imagem.eixo.figure, arquivo, dpi=100):
+            for inicio in range(0, self.n, eventos_por_quadro):
+                imagem.aplica(self.registro[inicio:inicio + eventos_por_quadro])
+                imagem.quadro.set_data(imagem.pixels)
+                escritor.grab_frame()
+
+    def __len__(self):
+        return self.n
+
+    def __repr__(self):
+        return f"Rastro({self.n} eventos)"
@@ -0,0 +1,54 @@
+from functools import wraps
+from time import perf_counter
+
+import numpy as np
+
+SEM_PAI = -1
+
+
+def reconstroi(pais, destino):
+    """Caminho até ``destino`` seguindo o vetor de pais, em O(comprimento do caminho).
+
+    A primeira passada só conta os passos; a segunda preenche o vetor de saída de trás para frente, sem listas
+    intermediárias.
+    """
+    comprimento, x = 1, destino
+    while (x := pais.item(x)) != SEM_PAI:
+        comprimento += 1
+    caminho = np.empty(comprimento, dtype=np.int64)
+    x = destino
+    for k in range(comprimento - 1, -1, -1):
+        caminho[k] = x
+        x = pais.item(x)
+    return caminho
+
+
+def cronometra(busca):
+    """Decora uma busca para registrar no ``Resultado`` o tempo total da chamada, em segundos."""
+    @wraps(busca)
+    def cronometrada(*args, **kwargs):
+        inicio = perf_counter()
+        resultado = busca(*args, **kwargs)
+        resultado.tempo = perf_counter() - inicio
+        return resultado
+    return cronometrada
+
+
+class Resultado:
+    def __init__(self, caminho, custo, expandidos, fronteira_max=0, tempo=0.0):
+        self.caminho = caminho  # Estados (nas grades, índices de células) da origem ao destino, ou vazio.
+        self.custo = custo
+        self.expandidos = expandidos
+        self.fronteira_max = fronteira_max  # Maior tamanho atingido pela fronteira (ou lista aberta).
+        self.tempo = tempo  # Segundos gastos na busca.
+
+    @property
+    def encontrado(self):
+        return len(self.caminho) > 0
+
+    def coords(self, mapa):
+        return [mapa.coords(i) for i in self.caminho]
+
+    def __repr__(self):
+        return (f"Resultado(passos={len(self.caminho) - 1}, custo={self.custo}, expandidos={self.expandidos}, "
+                f"fronteira_max={self.fronteira_max}, tempo={self.tempo:.4f})")
@@ -0,0 +1,133 @@
+"""Jump Point Search para grades de 8 vizinhos com custo uniforme.
+
+Segue a variante sem corte de quinas, a mesma regra de diagonais do ``Mapa``. Os estados internos são posições na
+grade com moldura (``Mapa.com_moldura``), onde andar uma linha é somar ``L = ncolunas + 2`` e uma coluna, somar 1.
+"""
+
+import numpy as np
+
+from lab.busca.eventos import EXPANDE, ENFILEIRA
+from lab.busca.fronteira import ListaAberta
+from lab.busca.heuristicas import RAIZ2
+from lab.busca.mapa import mapa_de
+from lab.busca.resultado import Resultado, SEM_PAI, cronometra
+
+_TODAS = [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+
+
+def _sinal(x):
+    return (x > 0) - (x < 0)
+
+
+def _salta(livre, p, dl, dc, destino, L):
+    """Anda de ``p`` na direção (dl, dc) até achar um ponto de salto; devolve ``None`` se bater num obstáculo."""
+    passo = dl * L + dc
+    while True:
+        if not livre[p]:
+            return None
+        if p == destino:
+            return p
+        if dl and dc:
+            if _salta(livre, p + dl * L, dl, 0, destino, L) is not None:
+                return p
+            if _salta(livre, p + dc, 0, dc, destino, L) is not None:
+                return p
+            if not (livre[p + dl * L] and livre[p + dc]):
+                return None
+        elif dl:
+            # Vizinho forçado: lateral livre cuja célula de trás está bloqueada.
+            if (livre[p + 1] and not livre[p - passo + 1]) or (livre[p - 1] and not livre[p - passo - 1]):
+                return p
+        elif (livre[p + L] and not livre[p - passo + L]) or (livre[p - L] and not livre[p - passo - L]):
+            return p
+        p += passo
+
+
+def _direcoes(livre, p, pai, L):
+    """Direções que sobram após a poda por simetria, dada a direção de chegada."""
+    if pai == SEM_PAI:
+        return [(dl, dc) for dl, dc in _TODAS if livre[p + dl * L] and livre[p + dc]]
+    dl = _sinal(p // L - pai // L)
+    dc = _sinal(p % L - pai % L)
+    direcoes = []
+    if dl and dc:
+        vertical, horizontal = livre[p + dl * L], livre[p + dc]
+        if vertical:
+            direcoes.append((dl, 0))
+        if horizontal:
+            direcoes.append((0, dc))
+        if vertical and horizontal:
+            direcoes.append((dl, dc))
+        return direcoes
+    if dl:
+        frente, lados = livre[p + dl * L], [(0, lado) for lado in (1, -1) if livre[p + lado]]
+        if frente:
+            direcoes.append((dl, 0))
+            direcoes.extend((dl, lado) for _, lado in lados)
+    else:
+        frente, lados = livre[p + dc], [(lado, 0) for lado in (1, -1) if livre[p + lado * L]]
+        if frente:
+            direcoes.append((0, dc))
+            direcoes.extend((lado, dc) for lado, _ in lados)
+    return direcoes + lados
+
+
+def _para_mapa(p, L):
+    """Converte posições da grade com moldura de volta em índices do ``Mapa``."""
+    return (p // L - 1) * (L - 2) + p % L - 1
+
+
+def _octil(a, b, L):
+    dl, dc = abs(a // L - b // L), abs(a % L - b % L)
+    return dl + dc + (RAIZ2 - 2) * min(dl, dc)
+
+
+@cronometra
+def salto(mapa, origem, destino, observador=None):
+    """A* sobre pontos de salto; devolve o caminho completo, célula a célula, como as demais buscas."""
+    mapa = mapa_de(mapa)
+    if mapa.vizinhanca != 8 or (mapa.terreno is not None and mapa.terreno.max() > 1):
+        raise ValueError("Jump Point Search exige Mapa de 8 vizinhos com custo uniforme.")
+    livre, L = mapa.com_moldura(), mapa.ncolunas + 2
+    origem, destino = (divmod(mapa.estado(x), mapa.ncolunas) for x in (origem, destino))
+    origem, destino = (origem[0] + 1) * L + origem[1] + 1, (destino[0] + 1) * L + destino[1] + 1
+    if not livre[origem] or not livre[destino]:
+        # Células bloqueadas não têm arestas no ``Mapa``; os saltos, que só olham as células do caminho, as ignorariam.
+        return Resultado(np.empty(0, dtype=np.int64), np.inf, 0)
+    g = np.full(len(livre), np.inf)
+    pais = np.full(len(livre), SEM_PAI, dtype=np.int32)
+    aberta = ListaAberta(len(livre))
+    g[origem] = 0.0
+    aberta.insere(origem, _octil(origem, destino, L))
+    expandidos = 0
+    while (atual := aberta.retira()) is not None:
+        if observador is not None:
+            observador(EXPANDE, _para_mapa(atual, L))
+        if atual == destino:
+            return Resultado(_percorre(pais, destino, L), float(g[destino]), expandidos, aberta.maximo)
+        expandidos += 1
+        for dl, dc in _direcoes(livre, atual, int(pais[atual]), L):
+            ponto = _salta(livre, atual + dl * L + dc, dl, dc, destino, L)
+            if ponto is None or aberta.fechado(ponto):
+                continue
+            novo = g[atual] + _octil(atual, ponto, L)
+            if novo < g[ponto]:
+                g[ponto] = novo
+                pais[ponto] = atual
+                h = _octil(ponto, destino, L)
+                aberta.insere(ponto, novo + h, h)
+                if observador is not None:
+                    observador(ENFILEIRA, _para_mapa(ponto, L))
+    return Resultado(np.empty(0, dtype=np.int64), np.inf, expandidos, aberta.maximo)
+
+
+def _percorre(pais, destino, L):
+    """Liga os pontos de salto em linha reta (ou diagonal), recuperando todas as células do caminho."""
+    caminho = [destino]
+    while (pai := int(pais[caminho[-1]])) != SEM_PAI:
+        p = caminho[-1]
+        passo = _sinal(pai // L - p // L) * L + _sinal(pai % L - p % L)
+        while p != pai:
+            p += passo
+            caminho.append(p)
+    return _para_mapa(np.array(caminho[::-1], dtype=np.int64), L)
@@ -0,0 +1,68 @@
+"""Geradores de terreno para ``Mapa``: matrizes uint8 ``(nlinhas, ncolunas)`` com ``BLOQUEADO`` nos obstáculos.
+
+Todos são determinísticos dada a ``semente``. Com ``saida`` (por exemplo, ``np.lib.format.open_memmap``), o terreno
+é escrito direto no arquivo, em blocos de linhas, permitindo mapas maiores que a RAM.
+"""
+
+import numpy as np
+
+from lab.busca.mapa import BLOQUEADO
+
+_LINHAS_POR_BLOCO = 1024
+
+
+def _matriz(nlinhas, ncolunas, saida):
+    if saida is None:
+        return np.empty((nlinhas, ncolunas), dtype=np.uint8)
+    if saida.dtype != np.uint8 or saida.shape != (nlinhas, ncolunas):
+        raise ValueError(f"Saída deve ser uint8 {(nlinhas, ncolunas)}, não {saida.dtype} {saida.shape}.")
+    return saida
+
+
+def obstaculos(nlinhas, ncolunas, densidade=0.2, custo_maximo=1, semente=0, saida=None):
+    """Obstáculos independentes com probabilidade ``densidade``; células livres custam de 1 a ``custo_maximo``."""
+    rnd = np.random.default_rng(semente)
+    terreno = _matriz(nlinhas, ncolunas, saida)
+    for inicio in range(0, nlinhas, _LINHAS_POR_BLOCO):
+        bloco = terreno[inicio:inicio + _LINHAS_POR_BLOCO]
+        bloco[:] = rnd.integers(1, custo_maximo, size=bloco.shape, dtype=np.uint8, endpoint=True)
+        bloco[rnd.random(bloco.shape, dtype=np.float32) < densidade] = BLOQUEADO
+    return terreno
+
+
+def labirinto(nlinhas, ncolunas, semente=0, saida=None):
+    """Labirinto perfeito pelo algoritmo da árvore binária.
+
+    As salas ocupam linhas e colunas ímpares (contando de 0) e cada uma abre a parede ao norte ou a oeste.
+    """
+    rnd = np.random.default_rng(semente)
+    terreno = _matriz(nlinhas, ncolunas, saida)
+    terreno[:] = BLOQUEADO
+    terreno[1::2, 1::2] = 1
+    norte = rnd.random(terreno[1::2, 1::2].shape, dtype=np.float32) < 0.5
+    norte[:, 0] = True  # A primeira coluna de salas só pode abrir ao norte
+    norte[0, :] = False  # e a primeira linha, só a oeste; a sala (0, 0) não abre nada.
+    i, j = np.nonzero(norte)
+    terreno[2 * i, 2 * j + 1] = 1
+    i, j = np.nonzero(~norte)
+    terreno[2 * i[j > 0] + 1, 2 * j[j > 0]] = 1
+    return terreno
+
+
+def salas(nlinhas, ncolunas, tamanho=8, semente=0, saida=None):
+    """Salas quadradas de lado ``tamanho - 1`` separadas por paredes, com uma porta sorteada em cada parede."""
+    rnd = np.random.default_rng(semente)
+    terreno = _matriz(nlinhas, ncolunas, saida)
+    terreno[:] = 1
+    terreno[tamanho::tamanho, :] = BLOQUEADO
+    terreno[:, tamanho::tamanho] = BLOQUEADO
+    paredes_l, paredes_c = np.arange(tamanho, nlinhas, tamanho), np.arange(tamanho, ncolunas, tamanho)
+    blocos_l, blocos_c = np.arange(0, nlinhas, tamanho), np.arange(0, ncolunas, tamanho)
+    # Porta de cada trecho de parede horizontal (linha fixa) e vertical (coluna fixa).
+    l, c = np.meshgrid(paredes_l, blocos_c, indexing="ij")
+    c = c + 1 + rnd.integers(0, tamanho - 1, size=c.shape)
+    terreno[l[c < ncolunas], c[c < ncolunas]] = 1
+    l, c = np.meshgrid(blocos_l, paredes_c, indexing="ij")
+    l = l + 1 + rnd.integers(0, tamanho - 1, size=l.shape)
+    terreno[l[l < nlinhas], c[l < nlinhas]] = 1
+    return terreno
@@ -1,30 +1,152 @@
+from time import perf_counter
+
 import numpy as np
+from scipy import sparse
+
+# Uma linha por época treinada: instâncias que provocaram correção, atualizações dos pesos e segundos gastos.
+HISTÓRICO = np.dtype([("erros", np.int64), ("atualizações", np.int64), ("tempo", np.float64)])
 
 
 def degrau(X):
     return np.heaviside(X, 0.5)
 
 
-def concatena_1s(X):
-    return np.hstack([X, np.ones((X.shape[0], 1))])  # Concatena uma coluna de 1s para multiplicar o "bias".
-
-
 class Perceptron:
-    def __init__(self, dimensionalidade, taxa_de_aprendizado=0.1, épocas=10, semente=0):
+    def __init__(self, dimensionalidade, taxa_de_aprendizado=0.1, épocas=10, semente=0, lote=1, classes=None,
+                 multiclasse="um_contra_todos", tolerância=0.0, paciência=None, média=False):
         rnd = np.random.default_rng(semente)
-        self.W = rnd.normal(size=dimensionalidade + 1)  # A matriz de pesos inclui peso 1 para o intercepto ("bias").
+        # ``W`` tem os pesos das variáveis e ``b``, o do intercepto ("bias"), sem coluna de 1s nos dados; com
+        # ``classes``, há uma linha de ``W`` e um ``b`` por classe.
+        pesos = rnd.normal(size=dimensionalidade + 1 if classes is None else (classes, dimensionalidade + 1))
+        self.W, self.b = pesos[..., :-1].copy(), pesos[..., -1].copy()
         self.λ = taxa_de_aprendizado
         self.épocas = épocas
+        # Instâncias por atualização: 1 é o perceptron online, na ordem exata das instâncias; None usa todas de uma vez.
+        self.lote = lote
+        # Com várias classes (rótulos 0, 1, ..., classes - 1), "um_contra_todos" treina cada linha como um perceptron
+        # binário da sua classe contra as demais; "crammer_singer" só corrige, a cada erro, a linha da classe certa
+        # (para cima) e a da prevista (para baixo).
+        if multiclasse not in ("um_contra_todos", "crammer_singer"):
+            raise ValueError(f"Estratégia multiclasse desconhecida: {multiclasse}.")
+        self.multiclasse = multiclasse
+        # O treino para antes de ``épocas`` se a fração de instâncias com erro numa época não passar de ``tolerância``
+        # (com 0, quando uma época não corrige nada) ou se o número de erros não melhorar por ``paciência`` épocas.
+        self.tolerância = tolerância
+        self.paciência = paciência
+        self.histórico = np.empty(0, dtype=HISTÓRICO)
+        # Perceptron médio: prediz com a média dos pesos ao longo de todas as instâncias vistas, mais estável quando os
+        # dados não são separáveis. A média é mantida de forma preguiçosa: cada correção Δ, feita no instante ``t``
+        # (contado em instâncias), soma ``t Δ`` em ``U`` (e em ``Ub``, para ``b``), e a média é ``W - U / t`` ao final;
+        # instâncias sem correção custam só o incremento de ``t``.
+        self.média = média
+        self.U, self.Ub = np.zeros_like(self.W), np.zeros_like(self.b)
+        self.t = 1
+
+    @property
+    def pesos(self):
+        """Pesos ``(W, b)`` usados na predição: os atuais ou, com ``média``, a média deles."""
+        if self.média:
+            return self.W - self.U / self.t, self.b - self.Ub / self.t
+        return self.W, self.b
 
     def predizer(self, X):
-        X = concatena_1s(X)
-        return degrau(X @ self.W)
+        """Aceita matrizes densas ou ``scipy.sparse``; as contas ficam no tipo de ``X`` após o treino."""
+        W, b = self.pesos
+        if W.ndim == 2:
+            return np.argmax(X @ W.T + b, axis=1)
+        return degrau(X @ W + b)
+
+    def correções(self, pontuações, Y):
+        """Direção da correção para cada instância (e, com várias classes, para cada classe), dadas as pontuações."""
+        if self.W.ndim == 1:
+            return (Y - degrau(pontuações)).astype(pontuações.dtype, copy=False)
+        linhas = np.arange(len(pontuações))
+        if self.multiclasse == "um_contra_todos":
+            erros = -degrau(pontuações)
+            erros[linhas, Y] += 1
+            return erros
+        predições = np.argmax(pontuações, axis=1)
+        erros = np.zeros_like(pontuações)
+        errou = predições != Y
+        erros[linhas[errou], Y[errou]] = 1
+        erros[linhas[errou], predições[errou]] = -1
+        return erros
+
+    def _corrige(self, ΔW, Δb, colunas=slice(None)):
+        self.W[..., colunas] += ΔW
+        self.b += Δb
+        if self.média:
+            self.U[..., colunas] += self.t * ΔW
+            self.Ub += self.t * Δb
+
+    def _online(self, X, Y):
+        """Uma época do perceptron online; em matriz esparsa, cada correção só toca as variáveis não nulas da linha."""
+        erros = 0
+        esparsa, binário = sparse.issparse(X), self.W.ndim == 1
+        for i in range(X.shape[0]):
+            if esparsa:
+                colunas = X.indices[X.indptr[i]:X.indptr[i + 1]]
+                x, W = X.data[X.indptr[i]:X.indptr[i + 1]], self.W[..., colunas]
+            else:
+                colunas, x, W = slice(None), X[i], self.W
+            pontuação = W @ x + self.b
+            if binário:
+                correção = Y[i] - degrau(pontuação)  # A variável 'correção' dá a direção da correção.
+                errou = correção != 0
+            else:
+                correção = self.correções(pontuação[None], Y[i:i + 1])[0]
+                errou = correção.any()
+            if errou:
+                correção = correção.astype(self.W.dtype)  # Em X inteiro ou bool, -1 não caberia no tipo de x.
+                self._corrige(self.λ * np.multiply.outer(correção, x), self.λ * correção, colunas)
+                erros += 1
+            self.t += 1
+        return erros
 
     def aprender(self, X, Y):
-        X = concatena_1s(X)
+        """Treina por até ``épocas`` épocas e devolve o histórico (``HISTÓRICO``) das épocas treinadas.
+
+        ``X`` pode ser densa ou ``scipy.sparse``, e nunca é copiada com uma coluna de 1s; os pesos passam a ter o tipo
+        de ``X`` (por exemplo, float32), para que predições e correções não promovam os dados a float64.
+        """
+        if sparse.issparse(X):
+            X = X.tocsr()
+        tipo = X.dtype if np.issubdtype(X.dtype, np.floating) else np.float64
+        self.W, self.b, self.U, self.Ub = (v.astype(tipo, copy=False) for v in (self.W, self.b, self.U, self.Ub))
+        Y = np.asarray(Y)
+        if self.W.ndim == 2:
+            # Os rótulos indexam as linhas de ``W``; rótulos float (comuns vindos de pandas ou CSV) viram inteiros.
+            rótulos = Y.astype(np.intp)
+            if np.any(rótulos != Y):
+                raise ValueError("Com classes, os rótulos devem ser inteiros de 0 a classes - 1.")
+            Y = rótulos
+        n = X.shape[0]
+        lote = n if self.lote is None else self.lote
+        histórico = np.zeros(self.épocas, dtype=HISTÓRICO)
+        melhor, sem_melhora = np.inf, 0
         for época in range(self.épocas):
-            # Atualiza matriz de pesos a cada nova instância.
-            for x, y in zip(X, Y):
-                predição = degrau(x @ self.W)
-                erro = y - predição  # A variável 'erro' dá a direção da correção.
-                self.W += self.λ * erro * x
+            início_da_época = perf_counter()
+            erros = atualizações = 0
+            if lote == 1:
+                # Atualiza matriz de pesos a cada nova instância.
+                erros = atualizações = self._online(X, Y)
+            else:
+                # Prediz o lote inteiro com os mesmos pesos e soma as correções de todas as instâncias (e de todas as
+                # classes) numa só operação.
+                for início in range(0, n, lote):
+                    X_lote = X[início:início + lote]
+                    correções = self.correções(X_lote @ self.W.T + self.b, Y[início:início + lote])
+                    errados = np.count_nonzero(correções if correções.ndim == 1 else correções.any(axis=1))
+                    self.t += X_lote.shape[0] - 1  # A correção vale a partir da última instância do lote.
+                    if errados:
+                        self._corrige(self.λ * (X_lote.T @ correções).T, self.λ * correções.sum(axis=0))
+                        erros += errados
+                        atualizações += 1
+                    self.t += 1
+            histórico[época] = erros, atualizações, perf_counter() - início_da_época
+            melhor, sem_melhora = (erros, 0) if erros < melhor else (melhor, sem_melhora + 1)
+            if erros <= self.tolerância * n or (self.paciência is not None and sem_melhora >= self.paciência):
+                histórico = histórico[:época + 1]
+                break
+        self.histórico = np.concatenate([self.histórico, histórico])
+        return histórico
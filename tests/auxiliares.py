@@ -0,0 +1,26 @@
+"""Mapas sorteados e conferências comuns aos testes de ``lab.busca``."""
+
+import numpy as np
+import pytest
+
+from lab.busca import Mapa
+from lab.busca.terreno import obstaculos
+
+SEMENTES = range(10)
+VIZINHANCAS = [4, 8, 6]
+
+
+def mapa_sorteado(semente, vizinhanca, lado=16, densidade=0.2, custo_maximo=3):
+    """Mapa com obstáculos e custos sorteados; origem e destino são a primeira e a última células livres."""
+    terreno = obstaculos(lado, lado, densidade=densidade, custo_maximo=custo_maximo, semente=semente)
+    livres = np.flatnonzero(terreno.ravel())
+    return Mapa(lado, lado, vizinhanca, terreno), int(livres[0]), int(livres[-1])
+
+
+def confere_caminho(mapa, resultado, origem, destino):
+    """O caminho liga origem e destino por vizinhos, e o custo declarado é o de percorrê-lo."""
+    caminho = resultado.caminho.tolist()
+    assert caminho[0] == origem and caminho[-1] == destino
+    for a, b in zip(caminho, caminho[1:]):
+        assert b in mapa.sucessores(a).tolist()
+    assert resultado.custo == pytest.approx(mapa.custo(resultado.caminho))
@@ -0,0 +1,39 @@
+import pytest
+
+from auxiliares import SEMENTES, VIZINHANCAS, confere_caminho, mapa_sorteado
+from lab.busca.anytime import ara_estrela, solucoes
+from lab.busca.informada import custo_uniforme
+
+
+@pytest.mark.parametrize("vizinhanca", VIZINHANCAS)
+@pytest.mark.parametrize("semente", SEMENTES)
+def test_ara_estrela_concorda_com_custo_uniforme(vizinhanca, semente):
+    mapa, origem, destino = mapa_sorteado(semente, vizinhanca)
+    referencia = custo_uniforme(mapa, origem, destino)
+    resultado = ara_estrela(mapa, origem, destino)
+    assert resultado.custo == pytest.approx(referencia.custo)
+    if referencia.encontrado:
+        confere_caminho(mapa, resultado, origem, destino)
+
+
+@pytest.mark.parametrize("semente", SEMENTES)
+def test_ara_estrela_respeita_o_limite_de_cada_solucao(semente):
+    mapa, origem, destino = mapa_sorteado(semente, 8, lado=32)
+    otimo = custo_uniforme(mapa, origem, destino).custo
+    custos = []
+    for solucao in solucoes(mapa, origem, destino, peso=3.0):
+        assert solucao.custo <= solucao.limite * otimo + 1e-9
+        custos.append(solucao.custo)
+    assert custos == sorted(custos, reverse=True)
+    assert custos[-1] == pytest.approx(otimo)
+
+
+@pytest.mark.parametrize("semente", SEMENTES)
+def test_orcamento_limita_as_expansoes(semente):
+    mapa, origem, destino = mapa_sorteado(semente, 8, lado=32)
+    otimo = custo_uniforme(mapa, origem, destino).custo
+    parciais = list(solucoes(mapa, origem, destino, peso=3.0, orcamento=150))
+    assert 0 < len(parciais) < len(list(solucoes(mapa, origem, destino, peso=3.0)))
+    for solucao in parciais:
+        assert solucao.expandidos <= 150
+        assert solucao.custo <= solucao.limite * otimo + 1e-9
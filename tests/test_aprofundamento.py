@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from auxiliares import SEMENTES, VIZINHANCAS, confere_caminho, mapa_sorteado
+from lab.busca.aprofundamento import TabelaDeTransposicao, aprofundamento_iterativo, ida_estrela
+from lab.busca.cega import largura_vetorizada
+from lab.busca.informada import custo_uniforme
+
+
+@pytest.mark.parametrize("vizinhanca", VIZINHANCAS)
+@pytest.mark.parametrize("semente", SEMENTES)
+def test_aprofundamento_iterativo(vizinhanca, semente):
+    # Mapas pequenos: sem caminho, as buscas de aprofundamento tentam todas as rotas simples.
+    mapa, origem, destino = mapa_sorteado(semente, vizinhanca, lado=5, densidade=0.15)
+    otimo = custo_uniforme(mapa, origem, destino)
+    if not otimo.encontrado:
+        pytest.skip("destino inalcançável")
+    passos = len(largura_vetorizada(mapa, origem, destino).caminho)
+    for tabela in (None, TabelaDeTransposicao()):
+        resultado = ida_estrela(mapa, origem, destino, tabela=tabela)
+        assert resultado.custo == pytest.approx(otimo.custo)
+        confere_caminho(mapa, resultado, origem, destino)
+        resultado = aprofundamento_iterativo(mapa, origem, destino, tabela=tabela)
+        assert len(resultado.caminho) == passos
+        confere_caminho(mapa, resultado, origem, destino)
+
+
+def test_tabela_de_transposicao_respeita_a_capacidade():
+    tabela = TabelaDeTransposicao(capacidade=2)
+    assert not tabela.poda(1, 5.0)
+    assert tabela.poda(1, 5.0) and not tabela.poda(1, 4.0)  # Só poda quem chega com custo maior ou igual.
+    tabela.poda(2, 1.0)
+    tabela.poda(3, 1.0)  # Cheia: a entrada mais antiga (1) sai.
+    assert len(tabela) == 2 and not tabela.poda(1, 9.0)
+
+
+def test_limite_maximo_encerra_sem_caminho():
+    mapa, origem, destino = mapa_sorteado(0, 4, lado=8)
+    resultado = ida_estrela(mapa, origem, destino, limite_maximo=1)
+    assert not resultado.encontrado and resultado.custo == np.inf
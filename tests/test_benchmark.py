@@ -0,0 +1,18 @@
+import json
+
+from lab.busca.benchmark import ALGORITMOS, executa, salva
+
+
+def test_json_estrito_mesmo_sem_caminho(tmp_path):
+    # Com muitos obstáculos, vários pares ficam sem caminho, e o custo infinito não pode virar ``Infinity``.
+    medidas = executa(tamanhos=(15,), densidades=(0.45,), pares=4, memoria=False)
+    assert len(medidas) == 4 * len(ALGORITMOS)
+    assert any(m["custo"] is None for m in medidas)
+    assert all((m["custo"] is None) == (not m["encontrado"]) for m in medidas)
+    arquivo = tmp_path / "bench.json"
+    salva(medidas, arquivo)
+
+    def rejeita(token):
+        raise ValueError(token)
+    dados = json.loads(arquivo.read_text(), parse_constant=rejeita)
+    assert len(dados["medidas"]) == len(medidas) and "versoes" in dados
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from auxiliares import SEMENTES, VIZINHANCAS, confere_caminho, mapa_sorteado
+from lab.busca.campo import CacheDeCampos, CampoDeDistancias
+from lab.busca.cega import largura_vetorizada
+from lab.busca.informada import custo_uniforme
+
+
+@pytest.mark.parametrize("vizinhanca", VIZINHANCAS)
+@pytest.mark.parametrize("semente", SEMENTES)
+def test_distancias_concordam_com_buscas_diretas(vizinhanca, semente):
+    mapa, _, destino = mapa_sorteado(semente, vizinhanca)
+    campo, em_passos = CampoDeDistancias(mapa, destino), CampoDeDistancias(mapa, destino, passos=True)
+    for origem in np.random.default_rng(semente).choice(np.flatnonzero(mapa.terreno), size=5).tolist():
+        referencia = custo_uniforme(mapa, origem, destino)
+        assert campo.distancia(origem) == pytest.approx(referencia.custo)
+        passos = len(largura_vetorizada(mapa, origem, destino).caminho) - 1
+        assert em_passos.distancia(origem) == (passos if referencia.encontrado else np.inf)
+        resultado = campo.caminho(origem)
+        if referencia.encontrado:
+            confere_caminho(mapa, resultado, origem, destino)
+            if origem != destino:
+                assert campo.passo(origem) == resultado.caminho[1]
+
+
+def test_cache_reaproveita_e_invalida():
+    mapa, origem, destino = mapa_sorteado(0, 8)
+    cache = CacheDeCampos()
+    campo = cache(mapa, destino)
+    assert cache(mapa, destino) is campo
+    assert cache(mapa, destino, passos=True) is not campo
+    mapa.altera([origem], [3])  # Nova versão do mapa: o campo antigo não serve mais.
+    novo = cache(mapa, destino)
+    assert novo is not campo and novo.versao == mapa.versao
+
+
+def test_cache_descarta_o_menos_usado():
+    mapa, origem, destino = mapa_sorteado(0, 8)
+    cache = CacheDeCampos(capacidade=2)
+    a, b = cache(mapa, destino), cache(mapa, origem)
+    assert cache(mapa, destino) is a  # ``a`` passa a ser o mais recente.
+    cache(mapa, destino, passos=True)
+    assert len(cache) == 2
+    assert cache(mapa, destino) is a and cache(mapa, origem) is not b
@@ -0,0 +1,42 @@
+import pytest
+
+from auxiliares import SEMENTES, VIZINHANCAS, confere_caminho, mapa_sorteado
+from lab.busca.cega import largura, largura_bidirecional, largura_vetorizada, profundidade
+
+
+@pytest.mark.parametrize("vizinhanca", VIZINHANCAS)
+@pytest.mark.parametrize("semente", SEMENTES)
+def test_largura_concorda_com_largura_vetorizada(vizinhanca, semente):
+    mapa, origem, destino = mapa_sorteado(semente, vizinhanca)
+    referencia = largura_vetorizada(mapa, origem, destino)
+    resultado = largura(mapa, origem, destino)
+    assert len(resultado.caminho) == len(referencia.caminho)
+    if referencia.encontrado:
+        confere_caminho(mapa, resultado, origem, destino)
+
+
+@pytest.mark.parametrize("vizinhanca", VIZINHANCAS)
+@pytest.mark.parametrize("semente", SEMENTES)
+def test_profundidade_acha_caminho_valido(vizinhanca, semente):
+    mapa, origem, destino = mapa_sorteado(semente, vizinhanca)
+    resultado = profundidade(mapa, origem, destino)
+    assert resultado.encontrado == largura_vetorizada(mapa, origem, destino).encontrado
+    if resultado.encontrado:
+        confere_caminho(mapa, resultado, origem, destino)
+
+
+@pytest.mark.parametrize("vizinhanca", VIZINHANCAS)
+@pytest.mark.parametrize("semente", SEMENTES)
+def test_largura_bidirecional_concorda_com_largura_vetorizada(vizinhanca, semente):
+    mapa, origem, destino = mapa_sorteado(semente, vizinhanca)
+    referencia = largura_vetorizada(mapa, origem, destino)
+    resultado = largura_bidirecional(mapa, origem, destino)
+    assert len(resultado.caminho) == len(referencia.caminho)
+    if referencia.encontrado:
+        confere_caminho(mapa, resultado, origem, destino)
+
+
+def test_largura_bidirecional_com_origem_no_destino():
+    mapa, origem, _ = mapa_sorteado(0, 4)
+    resultado = largura_bidirecional(mapa, origem, origem)
+    assert resultado.caminho.tolist() == [origem] and resultado.custo == 0
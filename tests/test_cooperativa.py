@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from lab.busca import Mapa
+from lab.busca.cooperativa import PlanejadorCooperativo, TabelaDeReservas
+from lab.busca.terreno import obstaculos
+
+
+def test_tabela_de_reservas_impede_colisao_e_troca():
+    reservas = TabelaDeReservas(10)
+    reservas.reserva(3, 1, agente=0)
+    assert not reservas.permite(2, 3, 0, agente=1)  # Colisão: 3 já é de 0 no instante 1.
+    assert reservas.permite(2, 3, 0, agente=0)
+    reservas.reserva(4, 0, agente=0)
+    reservas.reserva(5, 1, agente=0)
+    reservas.reserva(5, 0, agente=1)
+    assert not reservas.permite(5, 4, 0, agente=1)  # Troca: 0 vai de 4 para 5 enquanto 1 iria de 5 para 4.
+    reservas.libera([4, 5], 0, agente=0)
+    assert reservas.permite(5, 4, 0, agente=1)
+    reservas.descarta(2)
+    assert len(reservas) == 0
+
+
+@pytest.mark.parametrize("vizinhanca", [4, 8])
+@pytest.mark.parametrize("semente", range(5))
+def test_agentes_nao_colidem_nem_trocam_de_lugar(vizinhanca, semente):
+    terreno = obstaculos(16, 16, densidade=0.1, semente=semente)
+    mapa = Mapa(16, 16, vizinhanca, terreno)
+    rnd = np.random.default_rng(semente)
+    livres = rnd.permutation(np.flatnonzero(terreno.ravel()))
+    planejador = PlanejadorCooperativo(mapa, janela=8)
+    for origem, destino in zip(livres[:12].tolist(), livres[12:24].tolist()):
+        planejador.adiciona(origem, destino)
+    antes = planejador.posicoes()
+    for _ in range(200):
+        planejador.planeja()
+        depois = planejador.avanca()
+        assert len(set(depois.tolist())) == len(depois)
+        for a, b in zip(antes.tolist(), depois.tolist()):
+            assert a == b or b in mapa.sucessores(a).tolist()
+        trocas = {(a, b) for a, b in zip(antes.tolist(), depois.tolist()) if a != b}
+        assert not any((b, a) in trocas for a, b in trocas)
+        antes = depois
+        if planejador.chegaram.all():
+            break
+    assert planejador.chegaram.all()
+
+
+def test_recusa_origem_ocupada():
+    planejador = PlanejadorCooperativo(Mapa(4, 4, 4), janela=4)
+    planejador.adiciona(0, 15)
+    with pytest.raises(ValueError):
+        planejador.adiciona(0, 12)
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from lab.busca import Mapa
+from lab.busca.cega import largura_vetorizada
+from lab.busca.externa import LarguraExterna, largura_externa
+from lab.busca.eventos import EXPANDE
+from lab.busca.quebra_cabeca import QuebraCabeca
+from lab.busca.terreno import obstaculos
+
+
+class Interrompe(Exception):
+    pass
+
+
+def interrompe_apos(expansoes):
+    """Observador que simula uma queda depois de ``expansoes`` blocos expandidos."""
+    contagem = [0]
+
+    def observador(evento, estados):
+        if evento == EXPANDE:
+            contagem[0] += 1
+            if contagem[0] > expansoes:
+                raise Interrompe
+    return observador
+
+
+@pytest.mark.parametrize("vizinhanca", [4, 8, 6])
+@pytest.mark.parametrize("semente", range(5))
+def test_concorda_com_largura_vetorizada(tmp_path, vizinhanca, semente):
+    terreno = obstaculos(24, 24, densidade=0.25, custo_maximo=3, semente=semente)
+    mapa = Mapa(24, 24, vizinhanca, terreno)
+    livres = np.flatnonzero(terreno.ravel())
+    origem, destino = int(livres[0]), int(livres[-1])
+    referencia = largura_vetorizada(mapa, origem, destino)
+    resultado = largura_externa(mapa, origem, destino, str(tmp_path), bloco=16)
+    assert len(resultado.caminho) == len(referencia.caminho)
+    if referencia.encontrado:
+        assert resultado.caminho[0] == origem and resultado.caminho[-1] == destino
+        assert resultado.custo == pytest.approx(mapa.custo(resultado.caminho))
+
+
+def test_quebra_cabeca_de_8_exaustivo(tmp_path):
+    quebra_cabeca = QuebraCabeca([1, 2, 3, 4, 5, 6, 7, 8, 0])
+    busca = LarguraExterna(quebra_cabeca, quebra_cabeca.inicial, None, str(tmp_path))
+    busca.executa()
+    assert sum(busca.tamanhos) == 181440  # Metade das 9! permutações é alcançável.
+    assert busca.profundidade == 31
+
+
+@pytest.mark.parametrize("expansoes", [3, 40, 41, 100])
+def test_retoma_apos_interrupcao(tmp_path, expansoes):
+    quebra_cabeca = QuebraCabeca([8, 6, 7, 2, 5, 4, 3, 0, 1])
+    referencia = largura_externa(quebra_cabeca, quebra_cabeca.inicial, quebra_cabeca.final, str(tmp_path / "ref"))
+    diretorio = str(tmp_path / "interrompida")
+    # Blocos pequenos: cada camada grande é expandida em vários blocos, e a queda pode cair no meio de uma delas.
+    with pytest.raises(Interrompe):
+        largura_externa(quebra_cabeca, quebra_cabeca.inicial, quebra_cabeca.final, diretorio, bloco=512,
+                        observador=interrompe_apos(expansoes))
+    retomada = LarguraExterna(quebra_cabeca, quebra_cabeca.inicial, quebra_cabeca.final, diretorio, bloco=512)
+    assert 0 < retomada.profundidade < 31
+    resultado = retomada.executa()
+    assert len(resultado.caminho) == 32 and resultado.custo == 31
+    assert resultado.caminho[0] == quebra_cabeca.inicial and resultado.caminho[-1] == quebra_cabeca.final
+    assert retomada.tamanhos == LarguraExterna(quebra_cabeca, quebra_cabeca.inicial, quebra_cabeca.final,
+                                               str(tmp_path / "ref")).tamanhos
+    assert resultado.expandidos == referencia.expandidos
+
+
+def test_recusa_diretorio_de_outra_busca(tmp_path):
+    quebra_cabeca = QuebraCabeca([1, 2, 3, 4, 5, 6, 0, 7, 8])
+    largura_externa(quebra_cabeca, quebra_cabeca.inicial, quebra_cabeca.final, str(tmp_path))
+    with pytest.raises(ValueError):
+        LarguraExterna(quebra_cabeca, quebra_cabeca.final, quebra_cabeca.inicial, str(tmp_path))
+
+
+def test_recusa_retomar_com_outro_bloco(tmp_path):
+    quebra_cabeca = QuebraCabeca([8, 6, 7, 2, 5, 4, 3, 0, 1])
+    with pytest.raises(Interrompe):
+        largura_externa(quebra_cabeca, quebra_cabeca.inicial, quebra_cabeca.final, str(tmp_path), bloco=256,
+                        observador=interrompe_apos(40))
+    # As sequências já gravadas cobrem faixas de 256 estados; outro ``bloco`` as leria como se fossem outras faixas.
+    with pytest.raises(ValueError):
+        LarguraExterna(quebra_cabeca, quebra_cabeca.inicial, quebra_cabeca.final, str(tmp_path), bloco=4096)
+    resultado = largura_externa(quebra_cabeca, quebra_cabeca.inicial, quebra_cabeca.final, str(tmp_path), bloco=256)
+    assert resultado.custo == 31
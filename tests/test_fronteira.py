@@ -0,0 +1,33 @@
+from lab.busca.fronteira import Fronteira, ListaAberta
+
+
+def test_fila_e_pilha():
+    for n in (None, 10):
+        fila, pilha = Fronteira(n), Fronteira(n, lifo=True)
+        for x in (3, 1, 4):
+            assert fila.insere(x) and pilha.insere(x)
+        assert [fila.retira() for _ in range(3)] == [3, 1, 4]
+        assert [pilha.retira() for _ in range(3)] == [4, 1, 3]
+        assert not fila and not pilha
+
+
+def test_pertinencia_e_maximo():
+    for n in (None, 10):
+        fronteira = Fronteira(n)
+        assert fronteira.insere(5) and not fronteira.insere(5)
+        fronteira.insere(7)
+        assert 5 in fronteira and 7 in fronteira and 2 not in fronteira
+        fronteira.retira()
+        assert 5 not in fronteira and fronteira.insere(5)  # Depois de retirado, pode voltar.
+        assert len(fronteira) == 2 and fronteira.maximo == 2
+
+
+def test_lista_aberta_ordena_por_f_e_desempata_por_h():
+    aberta = ListaAberta(10)
+    aberta.insere(1, 5.0, 3.0)
+    aberta.insere(2, 5.0, 1.0)
+    aberta.insere(3, 4.0, 4.0)
+    aberta.insere(1, 2.0, 2.0)  # Reinserção com prioridade melhor; a entrada antiga fica obsoleta.
+    assert [aberta.retira() for _ in range(3)] == [1, 3, 2]
+    assert aberta.retira() is None  # A entrada antiga de 1 é descartada, pois 1 já foi fechado.
+    assert aberta.fechado(1) and aberta.maximo == 4
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from auxiliares import SEMENTES, VIZINHANCAS, confere_caminho, mapa_sorteado
+from lab.busca import Mapa
+from lab.busca.incremental import PlanejadorIncremental
+from lab.busca.informada import custo_uniforme
+
+
+@pytest.mark.parametrize("vizinhanca", VIZINHANCAS)
+@pytest.mark.parametrize("semente", SEMENTES)
+def test_lpa_estrela_concorda_com_custo_uniforme(vizinhanca, semente):
+    mapa, origem, destino = mapa_sorteado(semente, vizinhanca)
+    referencia = custo_uniforme(mapa, origem, destino)
+    resultado = PlanejadorIncremental(mapa, origem, destino).planeja()
+    assert resultado.custo == pytest.approx(referencia.custo)
+    if referencia.encontrado:
+        confere_caminho(mapa, resultado, origem, destino)
+
+
+@pytest.mark.parametrize("semente", SEMENTES)
+def test_lpa_estrela_replaneja_apos_alteracoes(semente):
+    mapa, origem, destino = mapa_sorteado(semente, 8, lado=20)
+    planejador = PlanejadorIncremental(mapa, origem, destino)
+    planejador.planeja()
+    rnd = np.random.default_rng(semente)
+    for _ in range(3):
+        celulas = rnd.choice(mapa.n, size=15, replace=False)
+        celulas = celulas[(celulas != origem) & (celulas != destino)]
+        planejador.atualiza(celulas, rnd.integers(0, 4, size=len(celulas)))
+        resultado = planejador.planeja()
+        atual = Mapa(mapa.nlinhas, mapa.ncolunas, 8, mapa.terreno.reshape(mapa.nlinhas, mapa.ncolunas).copy())
+        referencia = custo_uniforme(atual, origem, destino)
+        assert resultado.custo == pytest.approx(referencia.custo)
+        if referencia.encontrado:
+            confere_caminho(mapa, resultado, origem, destino)
+
+
+@pytest.mark.parametrize("semente", SEMENTES)
+def test_lpa_estrela_muda_destino_e_origem(semente):
+    mapa, origem, destino = mapa_sorteado(semente, 8, lado=20)
+    livres = np.flatnonzero(mapa.terreno)
+    planejador = PlanejadorIncremental(mapa, origem, destino)
+    planejador.planeja()
+    novo_destino, nova_origem = int(livres[len(livres) // 2]), int(livres[len(livres) // 3])
+    planejador.muda_destino(novo_destino)
+    resultado = planejador.planeja()
+    referencia = custo_uniforme(mapa, origem, novo_destino)
+    assert resultado.custo == pytest.approx(referencia.custo)
+    if referencia.encontrado:
+        confere_caminho(mapa, resultado, origem, novo_destino)
+    planejador.muda_origem(nova_origem)
+    resultado = planejador.planeja()
+    referencia = custo_uniforme(mapa, nova_origem, novo_destino)
+    assert resultado.custo == pytest.approx(referencia.custo)
+    if referencia.encontrado:
+        confere_caminho(mapa, resultado, nova_origem, novo_destino)
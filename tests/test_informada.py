@@ -0,0 +1,35 @@
+import pytest
+
+from auxiliares import SEMENTES, VIZINHANCAS, confere_caminho, mapa_sorteado
+from lab.busca.heuristicas import manhattan
+from lab.busca.informada import a_estrela, custo_uniforme, gulosa
+
+
+@pytest.mark.parametrize("vizinhanca", VIZINHANCAS)
+@pytest.mark.parametrize("semente", SEMENTES)
+def test_a_estrela_concorda_com_custo_uniforme(vizinhanca, semente):
+    mapa, origem, destino = mapa_sorteado(semente, vizinhanca)
+    referencia = custo_uniforme(mapa, origem, destino)
+    resultado = a_estrela(mapa, origem, destino)
+    assert resultado.custo == pytest.approx(referencia.custo)
+    assert resultado.expandidos <= referencia.expandidos
+    if referencia.encontrado:
+        confere_caminho(mapa, referencia, origem, destino)
+        confere_caminho(mapa, resultado, origem, destino)
+
+
+@pytest.mark.parametrize("vizinhanca", VIZINHANCAS)
+@pytest.mark.parametrize("semente", SEMENTES)
+def test_gulosa_acha_caminho_valido(vizinhanca, semente):
+    mapa, origem, destino = mapa_sorteado(semente, vizinhanca)
+    resultado = gulosa(mapa, origem, destino)
+    assert resultado.encontrado == custo_uniforme(mapa, origem, destino).encontrado
+    if resultado.encontrado:
+        confere_caminho(mapa, resultado, origem, destino)
+
+
+def test_heuristica_explicita():
+    # Manhattan é admissível em 4 vizinhos; passada explicitamente, substitui a padrão.
+    mapa, origem, destino = mapa_sorteado(0, 4)
+    resultado = a_estrela(mapa, origem, destino, heuristica=manhattan)
+    assert resultado.custo == pytest.approx(custo_uniforme(mapa, origem, destino).custo)
@@ -0,0 +1,32 @@
+import numpy as np
+
+from auxiliares import mapa_sorteado
+from lab.busca import Mapa
+from lab.busca.montecarlo import caminhadas
+
+
+def test_mesma_semente_da_mesmas_caminhadas_com_ou_sem_processos():
+    mapa, origem, destino = mapa_sorteado(0, 4, lado=8)
+    sequencial = caminhadas(mapa, origem, destino, episodios=1000, semente=7, lote=300)
+    paralelo = caminhadas(mapa, origem, destino, episodios=1000, semente=7, lote=300, processos=2)
+    assert np.array_equal(sequencial.passos, paralelo.passos)
+    assert np.array_equal(sequencial.passos, caminhadas(mapa, origem, destino, 1000, semente=7, lote=300).passos)
+    assert not np.array_equal(sequencial.passos, caminhadas(mapa, origem, destino, 1000, semente=8, lote=300).passos)
+
+
+def test_passos_sao_caminhadas_sem_repeticao():
+    mapa = Mapa(6, 6)
+    estatisticas = caminhadas(mapa, 0, 35, episodios=500, semente=1)
+    assert estatisticas.episodios == 500
+    chegaram = estatisticas.tempos
+    assert len(chegaram) == estatisticas.acertos > 0
+    # Sem revisitar células, são ao menos os 10 passos da distância de Manhattan e no máximo 35.
+    assert chegaram.min() >= 10 and chegaram.max() <= 35
+    assert np.all((estatisticas.passos == -1) | (estatisticas.passos >= 10))
+
+
+def test_casos_degenerados():
+    mapa = Mapa(4, 4)
+    assert np.array_equal(caminhadas(mapa, 5, 5, episodios=3).passos, [0, 0, 0])
+    vazia = caminhadas(mapa, 0, 15, episodios=0)
+    assert vazia.episodios == 0 and np.isnan(vazia.taxa_de_acerto) and np.isnan(vazia.media())
@@ -0,0 +1,189 @@
+import numpy as np
+import pytest
+from scipy import sparse
+
+from lab.perceptron import Perceptron, degrau
+
+
+def separáveis(semente=0, n=200, dimensionalidade=5, margem=0.3):
+    """Dados linearmente separáveis, sem instâncias a menos de ``margem`` do hiperplano que os separa."""
+    rnd = np.random.default_rng(semente)
+    X = rnd.normal(size=(4 * n, dimensionalidade))
+    w = rnd.normal(size=dimensionalidade)
+    distâncias = (X @ w + 0.5) / np.linalg.norm(w)
+    longe = np.abs(distâncias) > margem
+    return X[longe][:n], (distâncias[longe][:n] > 0).astype(np.float64)
+
+
+def test_online_segue_a_regra_do_perceptron():
+    X, Y = separáveis(n=50)
+    modelo = Perceptron(X.shape[1], épocas=3, semente=1)
+    W, b = modelo.W.copy(), modelo.b.copy()
+    for _ in range(3):
+        for x, y in zip(X, Y):
+            correção = y - degrau(x @ W + b)
+            W += 0.1 * correção * x
+            b += 0.1 * correção
+    modelo.aprender(X, Y)
+    assert np.allclose(modelo.W, W) and np.allclose(modelo.b, b)
+
+
+@pytest.mark.parametrize("lote", [1, 8, None])
+def test_lotes_separam_dados_separaveis(lote):
+    X, Y = separáveis()
+    modelo = Perceptron(X.shape[1], épocas=500, lote=lote)
+    modelo.aprender(X, Y)
+    assert np.array_equal(modelo.predizer(X), Y)
+
+
+def test_lote_inteiro_soma_as_correcoes_de_todas_as_instancias():
+    X, Y = separáveis(n=50)
+    modelo = Perceptron(X.shape[1], épocas=1, lote=None)
+    W, b = modelo.W.copy(), modelo.b.copy()
+    correções = Y - degrau(X @ W + b)
+    modelo.aprender(X, Y)
+    assert np.allclose(modelo.W, W + 0.1 * correções @ X)
+    assert np.allclose(modelo.b, b + 0.1 * correções.sum())
+
+
+def agrupados(semente=0, n=300, classes=3, dimensionalidade=4):
+    """Uma nuvem gaussiana estreita por classe, com centros afastados: separáveis por qualquer estratégia."""
+    rnd = np.random.default_rng(semente)
+    centros = 6 * rnd.normal(size=(classes, dimensionalidade))
+    Y = rnd.integers(0, classes, size=n)
+    return centros[Y] + rnd.normal(scale=0.5, size=(n, dimensionalidade)), Y
+
+
+@pytest.mark.parametrize("multiclasse", ["um_contra_todos", "crammer_singer"])
+@pytest.mark.parametrize("lote", [1, None])
+def test_multiclasse_separa_classes_afastadas(multiclasse, lote):
+    X, Y = agrupados()
+    modelo = Perceptron(X.shape[1], épocas=200, classes=3, multiclasse=multiclasse, lote=lote)
+    modelo.aprender(X, Y)
+    assert modelo.W.shape == (3, X.shape[1]) and modelo.b.shape == (3,)
+    assert np.array_equal(modelo.predizer(X), Y)
+
+
+def test_crammer_singer_corrige_so_as_linhas_da_classe_certa_e_da_prevista():
+    X, Y = agrupados(n=1)
+    modelo = Perceptron(X.shape[1], épocas=1, classes=3, multiclasse="crammer_singer")
+    W = modelo.W.copy()
+    prevista = int(np.argmax(X @ W.T + modelo.b))
+    assert prevista != Y[0]
+    modelo.aprender(X, Y)
+    assert np.flatnonzero(np.any(modelo.W != W, axis=1)).tolist() == sorted([prevista, Y[0]])
+
+
+def test_rotulos_float_inteiros_sao_aceitos():
+    X, Y = agrupados()
+    inteiros = Perceptron(X.shape[1], épocas=5, classes=3)
+    inteiros.aprender(X, Y)
+    reais = Perceptron(X.shape[1], épocas=5, classes=3)
+    reais.aprender(X, Y.astype(np.float64))
+    assert np.array_equal(inteiros.W, reais.W)
+    with pytest.raises(ValueError):
+        Perceptron(X.shape[1], classes=3).aprender(X, Y + 0.5)
+
+
+def test_recusa_estrategia_multiclasse_desconhecida():
+    with pytest.raises(ValueError):
+        Perceptron(4, classes=3, multiclasse="todos_contra_todos")
+
+
+def test_para_quando_uma_epoca_nao_corrige_nada():
+    X, Y = separáveis()
+    modelo = Perceptron(X.shape[1], épocas=500)
+    histórico = modelo.aprender(X, Y)
+    assert 1 < len(histórico) < 500
+    assert histórico["erros"][-1] == 0 and np.all(histórico["erros"][:-1] > 0)
+    assert np.array_equal(histórico["erros"], histórico["atualizações"])  # Online: uma atualização por erro.
+    assert np.all(histórico["tempo"] >= 0)
+    modelo.aprender(X, Y)
+    assert len(modelo.histórico) == len(histórico) + 1  # Já separados, a nova chamada para na primeira época.
+
+
+def test_tolerancia_aceita_uma_fracao_de_erros():
+    X, Y = separáveis()
+    histórico = Perceptron(X.shape[1], épocas=500, tolerância=0.1).aprender(X, Y)
+    assert histórico["erros"][-1] <= 0.1 * len(X)
+    assert np.all(histórico["erros"][:-1] > 0.1 * len(X))
+
+
+def test_paciencia_para_quando_os_erros_nao_melhoram():
+    rnd = np.random.default_rng(0)
+    X, Y = rnd.normal(size=(200, 3)), rnd.integers(0, 2, size=200).astype(np.float64)  # Rótulos ao acaso.
+    histórico = Perceptron(3, épocas=500, paciência=5).aprender(X, Y)
+    assert len(histórico) < 500
+    erros = histórico["erros"]
+    assert erros[-5:].min() >= erros[:-5].min()  # As últimas 5 épocas não superaram a melhor anterior.
+
+
+@pytest.mark.parametrize("lote", [1, 4])
+def test_media_preguicosa_concorda_com_a_media_explicita(lote):
+    rnd = np.random.default_rng(0)
+    X, Y = rnd.normal(size=(30, 3)), rnd.integers(0, 2, size=30).astype(np.float64)
+    modelo = Perceptron(3, épocas=3, lote=lote, média=True, tolerância=-1)
+    # Média explícita: pesos iniciais e os vigentes após cada instância vista, com cada lote corrigido de uma vez.
+    W, b = modelo.W.copy(), modelo.b.copy()
+    soma_W, soma_b = W.copy(), b.copy()
+    for _ in range(3):
+        for início in range(0, len(X), lote):
+            X_lote, Y_lote = X[início:início + lote], Y[início:início + lote]
+            correções = Y_lote - degrau(X_lote @ W + b)
+            soma_W += (len(X_lote) - 1) * W
+            soma_b += (len(X_lote) - 1) * b
+            W, b = W + 0.1 * correções @ X_lote, b + 0.1 * correções.sum()
+            soma_W += W
+            soma_b += b
+    modelo.aprender(X, Y)
+    W_médio, b_médio = modelo.pesos
+    assert np.allclose(modelo.W, W) and np.allclose(W_médio, soma_W / (3 * len(X) + 1))
+    assert np.isclose(b_médio, soma_b / (3 * len(X) + 1))
+    assert np.array_equal(modelo.predizer(X), degrau(X @ W_médio + b_médio))
+
+
+def test_media_e_mais_estavel_que_os_ultimos_pesos_em_dados_ruidosos():
+    X, Y = separáveis(n=400, margem=0.0)
+    ruído = np.random.default_rng(1).random(len(Y)) < 0.1
+    Y_ruidoso = np.where(ruído, 1 - Y, Y)
+    comum = Perceptron(X.shape[1], épocas=20)
+    comum.aprender(X, Y_ruidoso)
+    médio = Perceptron(X.shape[1], épocas=20, média=True)
+    médio.aprender(X, Y_ruidoso)
+    assert np.mean(médio.predizer(X) == Y) >= np.mean(comum.predizer(X) == Y)
+
+
+@pytest.mark.parametrize("tipo", [np.uint8, np.int32, np.bool_])
+@pytest.mark.parametrize("lote", [1, None])
+def test_x_inteiro_ou_bool_treina_como_float64(tipo, lote):
+    X = np.array([[0, 0], [0, 1], [1, 0], [1, 1]])
+    Y = np.array([0.0, 0.0, 0.0, 1.0])  # E lógico.
+    referência = Perceptron(2, épocas=100, lote=lote)
+    referência.aprender(X.astype(np.float64), Y)
+    modelo = Perceptron(2, épocas=100, lote=lote)
+    modelo.aprender(X.astype(tipo), Y)
+    assert modelo.W.dtype == np.float64
+    assert np.array_equal(modelo.W, referência.W) and np.array_equal(modelo.b, referência.b)
+    assert np.array_equal(modelo.predizer(X.astype(tipo)), Y)
+
+
+def test_x_float32_mantem_o_tipo():
+    X, Y = separáveis()
+    modelo = Perceptron(X.shape[1], épocas=500)
+    modelo.aprender(X.astype(np.float32), Y)
+    assert modelo.W.dtype == modelo.b.dtype == np.float32
+    assert modelo.predizer(X.astype(np.float32)).dtype == np.float32
+    assert np.array_equal(modelo.predizer(X.astype(np.float32)), Y)
+
+
+@pytest.mark.parametrize("classes", [None, 3])
+@pytest.mark.parametrize("lote", [1, 16, None])
+def test_x_esparsa_concorda_com_densa(classes, lote):
+    X, Y = agrupados() if classes else separáveis()
+    X = np.where(np.random.default_rng(2).random(X.shape) < 0.5, 0.0, X)
+    densa = Perceptron(X.shape[1], épocas=5, lote=lote, classes=classes, média=True)
+    densa.aprender(X, Y)
+    esparsa = Perceptron(X.shape[1], épocas=5, lote=lote, classes=classes, média=True)
+    esparsa.aprender(sparse.csr_matrix(X), Y)
+    assert np.allclose(esparsa.W, densa.W) and np.allclose(esparsa.pesos[0], densa.pesos[0])
+    assert np.array_equal(esparsa.predizer(sparse.csr_matrix(X)), densa.predizer(X))
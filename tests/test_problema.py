@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from auxiliares import SEMENTES, VIZINHANCAS, confere_caminho, mapa_sorteado
+from lab.busca import problema
+from lab.busca.cega import largura_vetorizada
+from lab.busca.estados import TabelaDeEstados
+from lab.busca.informada import custo_uniforme
+from lab.busca.quebra_cabeca import QuebraCabeca
+
+# Buscas que devem achar o caminho de menor custo: nome -> função (problema) -> Resultado.
+OTIMAS = {
+    "a_estrela": problema.a_estrela,
+    "custo_uniforme": problema.custo_uniforme,
+}
+
+
+@pytest.mark.parametrize("nome", OTIMAS)
+@pytest.mark.parametrize("vizinhanca", VIZINHANCAS)
+@pytest.mark.parametrize("semente", SEMENTES)
+def test_buscas_otimas_concordam_com_custo_uniforme(nome, vizinhanca, semente):
+    mapa, origem, destino = mapa_sorteado(semente, vizinhanca)
+    referencia = custo_uniforme(mapa, origem, destino)
+    resultado = OTIMAS[nome](problema.ProblemaDeGrade(mapa, origem, destino))
+    assert resultado.custo == pytest.approx(referencia.custo)
+    if referencia.encontrado:
+        confere_caminho(mapa, resultado, origem, destino)
+
+
+@pytest.mark.parametrize("vizinhanca", VIZINHANCAS)
+@pytest.mark.parametrize("semente", SEMENTES)
+def test_largura_concorda_com_largura_vetorizada(vizinhanca, semente):
+    mapa, origem, destino = mapa_sorteado(semente, vizinhanca)
+    referencia = largura_vetorizada(mapa, origem, destino)
+    resultado = problema.largura(problema.ProblemaDeGrade(mapa, origem, destino))
+    assert len(resultado.caminho) == len(referencia.caminho)
+    if referencia.encontrado:
+        confere_caminho(mapa, resultado, origem, destino)
+
+
+def test_tabela_de_estados_sobrevive_ao_crescimento():
+    estados = np.unique(np.random.default_rng(0).integers(0, 2**63, size=50_000, dtype=np.uint64))
+    tabela = TabelaDeEstados(capacidade=4)
+    indices = [tabela.insere(int(x)) for x in estados]
+    assert indices == list(range(len(estados)))
+    assert len(tabela) == len(estados)
+    assert [tabela.indice(int(x)) for x in estados[::97]] == indices[::97]
+    assert tabela.insere(int(estados[123])) == 123
+    assert tabela.indice(int(estados.max()) + 1) == -1
+    assert np.array_equal(tabela.estados(np.arange(len(estados))), estados)
+
+
+def test_quebra_cabeca_de_8():
+    quebra_cabeca = QuebraCabeca([8, 6, 7, 2, 5, 4, 3, 0, 1])  # Uma das posições mais difíceis: 31 movimentos.
+    assert quebra_cabeca.resolvivel()
+    resultado = problema.a_estrela(quebra_cabeca)
+    assert resultado.custo == 31 and len(resultado.caminho) == 32
+    assert resultado.caminho[0] == quebra_cabeca.inicial and resultado.caminho[-1] == quebra_cabeca.final
+    for a, b in zip(resultado.caminho[:-1].tolist(), resultado.caminho[1:].tolist()):
+        assert b in quebra_cabeca.sucessores(a)
+    assert not QuebraCabeca([2, 1, 3, 4, 5, 6, 7, 8, 0]).resolvivel()
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from auxiliares import SEMENTES, confere_caminho, mapa_sorteado
+from lab.busca import Mapa
+from lab.busca.informada import a_estrela
+from lab.busca.salto import salto
+
+
+@pytest.mark.parametrize("semente", SEMENTES)
+def test_salto_concorda_com_a_estrela(semente):
+    mapa, origem, destino = mapa_sorteado(semente, 8, lado=32, custo_maximo=1)
+    referencia = a_estrela(mapa, origem, destino)
+    resultado = salto(mapa, origem, destino)
+    assert resultado.custo == pytest.approx(referencia.custo)
+    if referencia.encontrado:
+        confere_caminho(mapa, resultado, origem, destino)
+
+
+def test_salto_sem_caminho_de_ou_para_celula_bloqueada():
+    terreno = np.ones((10, 10), dtype=np.uint8)
+    terreno[0, 0] = 0
+    mapa = Mapa(10, 10, 8, terreno)
+    for origem, destino in ((0, 99), (99, 0)):
+        assert not a_estrela(mapa, origem, destino).encontrado
+        resultado = salto(mapa, origem, destino)
+        assert not resultado.encontrado and resultado.custo == np.inf
+
+
+def test_salto_exige_custo_uniforme_em_8_vizinhos():
+    with pytest.raises(ValueError):
+        salto(Mapa(5, 5, 4), 0, 24)
+    with pytest.raises(ValueError):
+        salto(mapa_sorteado(0, 8, custo_maximo=3)[0], 0, 24)